@@ -28,13 +28,16 @@ class MetricsCalculator:
     
     def calculate_gamma_environment(self, 
                                   gamma_exposures: List[GammaExposure],
-                                  current_price: float) -> Dict[str, Any]:
+                                  current_price: float,
+                                  arrays: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, Any]:
         """
         Analyze the gamma environment (positive vs negative gamma)
         
         Args:
             gamma_exposures: List of GammaExposure objects
             current_price: Current underlying price
+            arrays: Optional GammaExposure.to_arrays view of gamma_exposures
+                (e.g. from aggregate_by_strike(return_arrays=True)); built if omitted
             
         Returns:
             Dictionary with gamma environment analysis
@@ -47,7 +50,10 @@ class MetricsCalculator:
                 'description': 'No gamma data available'
             }
         
-        total_net_gamma = self.calculate_total_net_gamma(gamma_exposures)
+        if arrays is None:
+            arrays = GammaExposure.to_arrays(gamma_exposures)
+        net_gamma = arrays['net']
+        total_net_gamma = float(net_gamma.sum())
         
         # Determine environment type
         if total_net_gamma > 0:
@@ -61,7 +67,7 @@ class MetricsCalculator:
             description = 'Neutral Gamma Environment - Balanced gamma exposure'
         
         # Calculate environment strength (normalized by current price and open interest)
-        total_oi = sum(ge.total_open_interest for ge in gamma_exposures)
+        total_oi = int(arrays['oi'].sum())
         if total_oi > 0 and current_price > 0:
             # Normalize by price and open interest to get strength measure
             environment_strength = abs(total_net_gamma) / (current_price * total_oi)
@@ -72,8 +78,11 @@ class MetricsCalculator:
         strength_interpretation = self._interpret_environment_strength(environment_strength)
         
         # Additional analysis
-        positive_strikes = len([ge for ge in gamma_exposures if ge.net_gamma_exposure > 0])
-        negative_strikes = len([ge for ge in gamma_exposures if ge.net_gamma_exposure < 0])
+        # Count negative/neutral/positive strikes in one pass over the sign array (NaN counts as neutral)
+        signs = np.sign(np.nan_to_num(net_gamma, nan=0.0)).astype(np.int8)
+        negative_strikes, neutral_strikes, positive_strikes = (
+            int(n) for n in np.bincount(signs + 1, minlength=3)
+        )
         total_strikes = len(gamma_exposures)
         
         return {
@@ -84,7 +93,7 @@ class MetricsCalculator:
             'description': description,
             'positive_strikes': positive_strikes,
             'negative_strikes': negative_strikes,
-            'neutral_strikes': total_strikes - positive_strikes - negative_strikes,
+            'neutral_strikes': neutral_strikes,
             'positive_strike_percentage': (positive_strikes / total_strikes * 100) if total_strikes > 0 else 0,
             'negative_strike_percentage': (negative_strikes / total_strikes * 100) if total_strikes > 0 else 0,
             'gamma_flip_level': self._find_gamma_flip_level(gamma_exposures, current_price)
@@ -423,12 +432,11 @@ class MetricsCalculator:
                 'herfindahl_index': 0.0
             }
         
-        # Sort by absolute exposure (descending)
-        sorted_exposures = sorted(gamma_exposures, 
-                                key=lambda x: abs(x.net_gamma_exposure), 
-                                reverse=True)
-        
-        total_abs_exposure = sum(abs(ge.net_gamma_exposure) for ge in gamma_exposures)
+        # Absolute exposures gathered once, sorted descending
+        abs_exposure = np.abs(np.fromiter((ge.net_gamma_exposure for ge in gamma_exposures),
+                                          dtype=np.float64, count=len(gamma_exposures)))
+        sorted_abs = np.sort(abs_exposure)[::-1]
+        total_abs_exposure = float(abs_exposure.sum())
         
         if total_abs_exposure == 0:
             return {
@@ -437,16 +445,13 @@ class MetricsCalculator:
                 'herfindahl_index': 0.0
             }
         
-        # Top 5 concentration
-        top_5_exposure = sum(abs(ge.net_gamma_exposure) for ge in sorted_exposures[:5])
-        top_5_concentration = top_5_exposure / total_abs_exposure
-        
-        # Top 10 concentration
-        top_10_exposure = sum(abs(ge.net_gamma_exposure) for ge in sorted_exposures[:10])
-        top_10_concentration = top_10_exposure / total_abs_exposure
+        # Top 5 / top 10 concentration
+        top_5_concentration = float(sorted_abs[:5].sum()) / total_abs_exposure
+        top_10_concentration = float(sorted_abs[:10].sum()) / total_abs_exposure
         
         # Herfindahl-Hirschman Index
-        hhi = sum((abs(ge.net_gamma_exposure) / total_abs_exposure) ** 2 for ge in gamma_exposures)
+        shares = abs_exposure / total_abs_exposure
+        hhi = float(np.dot(shares, shares))
         
         return {
             'top_5_concentration': top_5_concentration,
@@ -454,21 +459,36 @@ class MetricsCalculator:
             'herfindahl_index': hhi
         }
     
-    def calculate_all_metrics(self, gamma_exposures: List[GammaExposure]) -> MarketMetrics:
+    def calculate_all_metrics(self, 
+                              gamma_exposures: List[GammaExposure],
+                              arrays: Optional[Dict[str, np.ndarray]] = None) -> MarketMetrics:
         """
         Calculate all market metrics and return as MarketMetrics object
         
         Args:
             gamma_exposures: List of GammaExposure objects
+            arrays: Optional GammaExposure.to_arrays view of gamma_exposures; built if omitted
             
         Returns:
             MarketMetrics object with all calculated metrics
         """
         try:
-            # Basic metrics
-            total_net_gamma = self.calculate_total_net_gamma(gamma_exposures)
-            gamma_weighted_avg_strike = self.calculate_gamma_weighted_average_strike(gamma_exposures)
-            call_put_gamma_ratio = self.calculate_call_put_gamma_ratio(gamma_exposures)
+            # Basic metrics, as in calculate_total_net_gamma, calculate_gamma_weighted_average_strike
+            # and calculate_call_put_gamma_ratio, but as reductions over the shared arrays
+            if arrays is None:
+                arrays = GammaExposure.to_arrays(gamma_exposures)
+            total_net_gamma = float(arrays['net'].sum())
+            
+            weights = np.abs(arrays['net'])
+            total_weight = float(weights.sum())
+            gamma_weighted_avg_strike = float((arrays['strike'] * weights).sum()) / total_weight if total_weight > 0 else 0.0
+            
+            total_call_gamma = float(np.abs(arrays['call']).sum())
+            total_put_gamma = float(np.abs(arrays['put']).sum())
+            if total_put_gamma == 0:
+                call_put_gamma_ratio = float('inf') if total_call_gamma > 0 else 0.0
+            else:
+                call_put_gamma_ratio = total_call_gamma / total_put_gamma
             
             # Max exposures
             max_exposures = self.calculate_max_exposures(gamma_exposures)
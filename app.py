@@ -7,16 +7,15 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import io
-from typing import Optional, Dict, Any
+import hashlib
+from typing import Optional, Dict, Any, List
 
 # Import our modules
 from data.processor import OptionsDataProcessor, DataValidationError
-from data.yfinance_fetcher import YFinanceOptionsFetcher, YFinanceFetchError
-from calculations.gamma import GammaCalculator, GammaCalculationError
-from analysis.walls import WallAnalyzer, WallAnalysisError
-from analysis.metrics import MetricsCalculator, MetricsCalculationError
-from visualization.charts import VisualizationEngine, VisualizationError
-from ui.export import ExportManager, ExportError
+from data.yfinance_fetcher import YFinanceOptionsFetcher, YFinanceFetchError, POPULAR_SYMBOLS
+from data.models import TickerSnapshot
+# Calculation, charting and export modules (and Plotly) are imported inside the
+# functions that use them, so a fresh session renders before any data is loaded
 
 # Configure page
 st.set_page_config(
@@ -26,6 +25,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Symbols offered in the "Popular Symbols" selector
+_SYMBOLS = tuple(POPULAR_SYMBOLS)
+
 # Initialize session state
 if 'data_loaded' not in st.session_state:
     st.session_state.data_loaded = False
@@ -38,11 +40,272 @@ if 'market_metrics' not in st.session_state:
 if 'current_price' not in st.session_state:
     st.session_state.current_price = 4500.0
 
-# Ensure current_price is within reasonable bounds
-if st.session_state.current_price < 10.0:
-    st.session_state.current_price = 4500.0
-elif st.session_state.current_price > 15000.0:
-    st.session_state.current_price = 4500.0
+def _options_data_hash(options_df: pd.DataFrame) -> str:
+    """Fingerprint the loaded options chain so cached results can be keyed on its content"""
+    row_hashes = pd.util.hash_pandas_object(options_df, index=False).to_numpy()
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+
+@st.cache_resource
+def _shared_engines():
+    """Wall analyzer, metrics calculator and chart engine shared by all sessions (all stateless)"""
+    from analysis.walls import WallAnalyzer
+    from analysis.metrics import MetricsCalculator
+    from visualization.charts import VisualizationEngine
+    
+    return WallAnalyzer(), MetricsCalculator(), VisualizationEngine()
+
+@st.cache_resource
+def _gamma_calculator(risk_free_rate: float):
+    """Gamma calculator for a risk-free rate, shared by all sessions"""
+    from calculations.gamma import GammaCalculator
+    
+    return GammaCalculator(risk_free_rate=risk_free_rate)
+
+def _engines(risk_free_rate: float):
+    """Return (gamma calculator, wall analyzer, metrics calculator, chart engine)"""
+    return (_gamma_calculator(risk_free_rate), *_shared_engines())
+
+@st.cache_data(show_spinner=False, ttl=300, max_entries=32)
+def _run_analysis_pipeline(data_hash: str, current_price: float, risk_free_rate: float, _options_df: pd.DataFrame):
+    """
+    Run the gamma, wall and metrics calculations for a loaded chain
+    
+    Cached on (data_hash, current_price, risk_free_rate) so reruns triggered by
+    unrelated widgets (chart selection, expanders) skip the recomputation.
+    The TTL bounds how stale the time-to-expiry inputs can get.
+    """
+    gamma_calc, wall_analyzer, metrics_calc, _ = _engines(risk_free_rate)
+    
+    gamma_exposures, exposure_arrays = gamma_calc.aggregate_by_strike_df(_options_df, current_price, return_arrays=True)
+    if not gamma_exposures:
+        return gamma_exposures, None, None, None, None
+    
+    walls = wall_analyzer.find_all_walls(gamma_exposures, current_price)
+    market_metrics = metrics_calc.calculate_all_metrics(gamma_exposures, arrays=exposure_arrays)
+    metrics_summary = metrics_calc.get_metrics_summary(gamma_exposures, current_price)
+    gamma_environment = metrics_calc.calculate_gamma_environment(gamma_exposures, current_price, arrays=exposure_arrays)
+    
+    return gamma_exposures, walls, market_metrics, metrics_summary, gamma_environment
+
+@st.cache_data(show_spinner=False, ttl=300, max_entries=64)
+def _build_chart(kind: str, pipeline_hash: str, symbol: str, _payload):
+    """
+    Build the selected Plotly figure for an analysis run
+    
+    Cached on (kind, pipeline_hash, symbol) so toggling between chart types
+    reuses figures already built for the same pipeline output.
+    """
+    from visualization.charts import VisualizationError
+    
+    gamma_exposures, walls, metrics_summary, current_price = _payload
+    viz_engine = _shared_engines()[2]
+    
+    if kind == "Comprehensive Analysis":
+        return viz_engine.create_comprehensive_chart(
+            gamma_exposures, walls, current_price,
+            f"{symbol} Gamma Exposure with Walls"
+        )
+    elif kind == "Net Gamma Exposure":
+        return viz_engine.create_gamma_exposure_chart(
+            gamma_exposures, current_price,
+            "Net Gamma Exposure by Strike"
+        )
+    elif kind == "Call vs Put Breakdown":
+        return viz_engine.create_call_put_breakdown_chart(
+            gamma_exposures, current_price,
+            "Call vs Put Gamma Exposure"
+        )
+    elif kind == "Metrics Summary":
+        return viz_engine.create_metrics_summary_chart(
+            metrics_summary,
+            "Gamma Exposure Metrics Dashboard"
+        )
+    raise VisualizationError(f"Unknown chart type: {kind}")
+
+@st.cache_data(show_spinner=False, ttl=60)
+def _ticker_snapshot(symbol: str) -> TickerSnapshot:
+    """Fetch price and expirations for a symbol, reused across reruns for a minute"""
+    return YFinanceOptionsFetcher().get_ticker_snapshot(symbol)
+
+@st.cache_data(show_spinner=False, ttl=60)
+def _cached_summary(symbol: str) -> Dict[str, Any]:
+    """Remote options summary for a symbol, reused across reruns for a minute"""
+    return YFinanceOptionsFetcher().get_options_summary(symbol)
+
+def _options_summary(symbol: str, snapshot: TickerSnapshot) -> Dict[str, Any]:
+    """
+    Build the options summary without a network call when possible
+    
+    Price and expirations come from the ticker snapshot; call/put counts and
+    the strike range come from the loaded chain when it belongs to this symbol
+    (using its nearest expiration, like the remote summary's sample chain).
+    Falls back to the cached remote summary otherwise.
+    """
+    options_df = st.session_state.get('options_data')
+    if (snapshot.current_price is None or options_df is None or options_df.empty
+            or st.session_state.get('current_symbol') != symbol):
+        return _cached_summary(symbol)
+    
+    expiry_dates = pd.to_datetime(options_df['expiry_date'])
+    sample_chain = options_df[expiry_dates == expiry_dates.min()]
+    type_counts = sample_chain.groupby('option_type').size()
+    strike_min, strike_max = sample_chain['strike'].agg(['min', 'max'])
+    
+    return {
+        'symbol': symbol,
+        'yf_symbol': POPULAR_SYMBOLS.get(symbol, symbol),
+        'current_price': snapshot.current_price,
+        'company_name': symbol,
+        'available_expirations': len(snapshot.expirations),
+        'expiration_dates': snapshot.expirations[:10],
+        'sample_expiration_stats': {
+            'total_calls': int(type_counts.get('call', 0)),
+            'total_puts': int(type_counts.get('put', 0)),
+            'strike_range': {'min': float(strike_min), 'max': float(strike_max)}
+        }
+    }
+
+def _markdown_lines(*lines: str) -> str:
+    """Join lines as separate markdown paragraphs, matching consecutive st.write calls"""
+    return "\n\n".join(lines)
+
+@st.cache_data(show_spinner=False)
+def _strength_panel_md(level: str, color: str, strength: float, volatility_impact: str, description: str):
+    """Build the two-column Environment Strength markdown once per strength reading"""
+    if level in ['Very Strong', 'Strong']:
+        implications = (
+            "• 🎯 **High confidence** in gamma effects",
+            "• 📈 **Strong** support/resistance at walls",
+            "• ⚡ **Significant** volatility changes expected"
+        )
+    elif level == 'Moderate':
+        implications = (
+            "• 🎯 **Moderate confidence** in gamma effects",
+            "• 📊 **Noticeable** but not dominant influence",
+            "• 🔄 **Some** volatility impact expected"
+        )
+    else:
+        implications = (
+            "• ⚠️ **Low confidence** in gamma effects",
+            "• 📉 **Minimal** market maker influence",
+            "• 🎲 **Other factors** likely more important"
+        )
+    
+    assessment_md = _markdown_lines(
+        "**Strength Assessment:**",
+        f"{color} **{level}** ({strength:.4f})",
+        f"📊 **Volatility Impact**: {volatility_impact}",
+        f"📝 {description}",
+        "**How It's Calculated:**",
+        "```\nStrength = |Total Net Gamma| / (Current Price × Total Open Interest)\n```",
+        "This normalizes gamma exposure by market size and price level"
+    )
+    scale_md = _markdown_lines(
+        "**Strength Scale Interpretation:**",
+        "🔴 **Very Strong (≥0.10)**: Dominant market maker forces",
+        "🟠 **Strong (0.05-0.10)**: Significant gamma impact",
+        "🟡 **Moderate (0.02-0.05)**: Noticeable influence",
+        "🟢 **Weak (0.01-0.02)**: Limited impact",
+        "⚪ **Very Weak (<0.01)**: Minimal influence",
+        "**Trading Implications:**",
+        *implications
+    )
+    return assessment_md, scale_md
+
+@st.cache_data(show_spinner=False)
+def _flip_panel_md(environment: str, direction: int, current_price: float, flip_level: float):
+    """
+    Build the gamma flip scenario panel for an environment and flip direction
+    
+    Returns:
+        (alert kind, headline, body markdown), or None when no scenario applies
+    """
+    prices = f"(Current: ${current_price:.0f} → Flip: ${flip_level:.0f})"
+    
+    if environment == 'positive' and direction > 0:
+        return "success", f"**Upside Breakout Scenario** {prices}", _markdown_lines(
+            "**Current Situation:**",
+            "• 🛡️ You're in the **protective zone** of positive gamma",
+            "• 📉 Market makers will **buy dips** and provide support",
+            "• 🔄 **Mean-reverting** price action expected",
+            "**If Price Rises Above Flip Level:**",
+            f"• ⚡ Environment flips to **negative gamma** above ${flip_level:.0f}",
+            "• 🚀 Market makers become **momentum amplifiers**",
+            "• 📈 **Breakout acceleration** potential",
+            "• 🌪️ **Higher volatility** environment"
+        )
+    elif environment == 'positive' and direction < 0:
+        return "warning", f"**Downside Risk Scenario** {prices}", _markdown_lines(
+            "**Current Situation:**",
+            "• 🛡️ Still in **positive gamma** territory",
+            "• 📈 Market makers provide **upward support**",
+            "**If Price Falls Below Flip Level:**",
+            f"• ⚡ Environment becomes **negative gamma** below ${flip_level:.0f}",
+            "• 📉 Market makers would **amplify downward moves**",
+            "• 💥 **Breakdown acceleration** risk"
+        )
+    elif environment == 'negative' and direction > 0:
+        return "error", f"**Resistance Above** {prices}", _markdown_lines(
+            "**Current Situation:**",
+            "• ⚡ You're in **negative gamma** territory",
+            "• 📈 Market makers **amplify moves** upward",
+            "**If Price Rises Above Flip Level:**",
+            f"• 🛡️ Environment becomes **positive gamma** above ${flip_level:.0f}",
+            "• 🔄 Market makers would provide **stabilization**",
+            "• 📊 **Lower volatility** expected"
+        )
+    elif environment == 'negative' and direction < 0:
+        return "error", f"**Support Below** {prices}", _markdown_lines(
+            "**Current Situation:**",
+            "• ⚡ You're in **negative gamma** territory",
+            "• 📉 Market makers **amplify moves** downward",
+            "**If Price Falls Below Flip Level:**",
+            f"• 🛡️ Environment becomes **positive gamma** below ${flip_level:.0f}",
+            "• 🔄 Market makers would provide **support**",
+            "• 📊 **Stabilization** expected"
+        )
+    return None
+
+@st.cache_data(show_spinner=False)
+def _distribution_panel_md(environment: str, positive_strikes: int, positive_pct: float,
+                           negative_strikes: int, negative_pct: float, neutral_strikes: int):
+    """Build the Strike Distribution and Market Implications markdown columns"""
+    distribution_md = _markdown_lines(
+        "**Strike Distribution:**",
+        f"• Positive Gamma Strikes: {positive_strikes} ({positive_pct:.1f}%)",
+        f"• Negative Gamma Strikes: {negative_strikes} ({negative_pct:.1f}%)",
+        f"• Neutral Strikes: {neutral_strikes}"
+    )
+    
+    if environment == 'positive':
+        implications = (
+            "• 🛡️ Market makers provide **stabilizing** force",
+            "• 📉 **Buy dips**, sell rallies",
+            "• 🔄 **Lower volatility** environment",
+            "• 💪 **Support** at key levels"
+        )
+    elif environment == 'negative':
+        implications = (
+            "• ⚡ Market makers **amplify** moves",
+            "• 📈 **Sell dips**, buy rallies",
+            "• 🌪️ **Higher volatility** environment",
+            "• 💥 **Momentum** acceleration"
+        )
+    else:
+        implications = (
+            "• ⚖️ **Balanced** gamma exposure",
+            "• 🎯 **Mixed** market maker flows",
+            "• 📊 **Moderate** volatility expected"
+        )
+    implications_md = _markdown_lines("**Market Implications:**", *implications)
+    
+    return distribution_md, implications_md
+
+def _metric_row(metrics: List[Dict[str, Any]]):
+    """Render a row of st.metric cells from keyword specs, one column per metric"""
+    for column, metric in zip(st.columns(len(metrics)), metrics):
+        with column:
+            st.metric(**metric)
 
 def render_sidebar():
     """Render sidebar with input controls"""
@@ -86,7 +349,6 @@ def render_data_input_section():
         
         # Initialize Yahoo Finance fetcher
         yf_fetcher = YFinanceOptionsFetcher()
-        available_symbols = yf_fetcher.get_available_symbols()
         
         col1, col2 = st.columns(2)
         
@@ -101,7 +363,7 @@ def render_data_input_section():
             if symbol_input_method == "Popular Symbols":
                 selected_symbol = st.selectbox(
                     "Select Symbol",
-                    options=list(available_symbols.keys()),
+                    options=_SYMBOLS,
                     index=1,  # Default to SPY
                     help="Choose from popular symbols with options"
                 )
@@ -112,17 +374,20 @@ def render_data_input_section():
                     help="Enter any valid ticker symbol (e.g., AAPL, TSLA, NVDA, AMD)"
                 ).upper()
                 
-                # Validate custom symbol
-                if selected_symbol:
-                    with st.spinner(f"Validating {selected_symbol}..."):
-                        if yf_fetcher.validate_symbol(selected_symbol):
-                            st.success(f"✅ {selected_symbol} has options data available")
-                        else:
-                            st.error(f"❌ {selected_symbol} does not have options data or is invalid")
+            # Price and expirations come from one Ticker round-trip (cached briefly)
+            with st.spinner(f"Fetching market data for {selected_symbol}..."):
+                snapshot = _ticker_snapshot(selected_symbol)
+            
+            # Validate custom symbol
+            if symbol_input_method == "Custom Ticker" and selected_symbol:
+                if snapshot.has_options:
+                    st.success(f"✅ {selected_symbol} has options data available")
+                else:
+                    st.error(f"❌ {selected_symbol} does not have options data or is invalid")
             
             # Get current price and update session state
-            try:
-                current_price = yf_fetcher.get_current_price(selected_symbol)
+            if snapshot.current_price is not None:
+                current_price = snapshot.current_price
                 # Ensure the price is within reasonable bounds before updating session state
                 if 10.0 <= current_price <= 15000.0:
                     st.session_state.current_price = current_price
@@ -130,15 +395,16 @@ def render_data_input_section():
                 else:
                     st.warning(f"Fetched price ${current_price:.2f} is outside expected range. Using current session value.")
                     current_price = st.session_state.current_price
-            except YFinanceFetchError as e:
-                st.warning(f"Could not fetch current price: {str(e)}")
+            else:
+                st.warning(f"Could not fetch current price: {snapshot.price_error}")
                 current_price = st.session_state.current_price
         
         with col2:
-            # Fetch expiration dates
+            # Expiration dates from the snapshot
             try:
-                with st.spinner("Fetching available expiration dates..."):
-                    expirations = yf_fetcher.get_expiration_dates(selected_symbol)
+                if snapshot.expirations_error:
+                    raise YFinanceFetchError(snapshot.expirations_error)
+                expirations = snapshot.expirations
                 
                 expiration_option = st.radio(
                     "Expiration Selection",
@@ -175,29 +441,24 @@ def render_data_input_section():
                         expiration_date=selected_expiration,
                         include_all_expirations=include_all
                     )
-                    
-                    # Convert to contracts
-                    contracts = yf_fetcher.convert_to_contracts(options_df)
                 
-                if contracts:
-                    # Store in session state
+                if not options_df.empty:
+                    # Store in session state (the analysis works on the DataFrame directly)
                     st.session_state.options_data = options_df
-                    st.session_state.options_contracts = contracts
                     st.session_state.data_loaded = True
                     st.session_state.current_symbol = selected_symbol  # Store the symbol
                     
                     # Display summary
                     # col1, col2, col3 = st.columns(3)
                     # with col1:
-                    #     st.metric("Total Contracts", len(contracts))
+                    #     st.metric("Total Contracts", len(options_df))
                     # with col2:
-                    #     unique_strikes = len(set(c.strike for c in contracts))
-                    #     st.metric("Unique Strikes", unique_strikes)
+                    #     st.metric("Unique Strikes", options_df['strike'].nunique())
                     # with col3:
-                    #     total_oi = sum(c.open_interest for c in contracts)
+                    #     total_oi = int(options_df['open_interest'].sum())
                     #     st.metric("Total Open Interest", f"{total_oi:,}")
                     
-                    st.success(f"✅ Successfully fetched {len(contracts)} option contracts from Yahoo Finance!")
+                    st.success(f"✅ Successfully fetched {len(options_df)} option contracts from Yahoo Finance!")
                     
                     # Show data preview - strikes closest to spot price
                     with st.expander("📋 Data Preview (15 strikes closest to spot)"):
@@ -213,7 +474,7 @@ def render_data_input_section():
                         preview_df = preview_df.sort_values(['strike', 'option_type'])
                         preview_df = preview_df.drop('distance_from_spot', axis=1)
                         
-                        st.dataframe(preview_df, width='stretch')
+                        st.table(preview_df.reset_index(drop=True))
                         st.caption(f"Showing options for 15 strikes closest to current price (${current_price:.2f})")
                 else:
                     st.warning("No valid options data found.")
@@ -227,7 +488,7 @@ def render_data_input_section():
         # if st.button("ℹ️ Show Options Summary", type="secondary"):
         #     try:
         #         with st.spinner("Getting options summary..."):
-        #             summary = yf_fetcher.get_options_summary(selected_symbol)
+        #             summary = _options_summary(selected_symbol, snapshot)
                 
         #         st.subheader(f"📊 {summary['symbol']} Options Summary")
                 
@@ -267,7 +528,6 @@ def render_data_input_section():
                 # Load and validate data
                 with st.spinner("Loading and validating data..."):
                     df = processor.load_options_data(uploaded_file)
-                    contracts = processor.convert_to_contracts(df)
                 
                 # Display data summary
                 summary = processor.get_data_summary(df)
@@ -288,10 +548,9 @@ def render_data_input_section():
                 
                 # Store in session state
                 st.session_state.options_data = df
-                st.session_state.options_contracts = contracts
                 st.session_state.data_loaded = True
                 
-                st.success(f"✅ Successfully loaded {len(contracts)} option contracts!")
+                st.success(f"✅ Successfully loaded {len(df)} option contracts!")
                 
                 # Show data preview - strikes closest to spot price
                 with st.expander("📋 Data Preview (15 strikes closest to spot)"):
@@ -310,7 +569,7 @@ def render_data_input_section():
                     preview_df = preview_df.sort_values(['strike', 'option_type'])
                     preview_df = preview_df.drop('distance_from_spot', axis=1)
                     
-                    st.dataframe(preview_df, width='stretch')
+                    st.table(preview_df.reset_index(drop=True))
                     st.caption(f"Showing options for 15 strikes closest to current price (${current_price:.2f})")
                 
             except DataValidationError as e:
@@ -345,14 +604,12 @@ def render_data_input_section():
                         num_strikes=num_strikes,
                         days_to_expiry=days_to_expiry
                     )
-                    contracts = processor.convert_to_contracts(df)
                 
                 # Store in session state
                 st.session_state.options_data = df
-                st.session_state.options_contracts = contracts
                 st.session_state.data_loaded = True
                 
-                st.success(f"✅ Generated {len(contracts)} sample option contracts!")
+                st.success(f"✅ Generated {len(df)} sample option contracts!")
                 
                 # Show data preview - strikes closest to spot price
                 with st.expander("📋 Sample Data Preview (15 strikes closest to spot)"):
@@ -368,12 +625,41 @@ def render_data_input_section():
                     preview_df = preview_df.sort_values(['strike', 'option_type'])
                     preview_df = preview_df.drop('distance_from_spot', axis=1)
                     
-                    st.dataframe(preview_df, width='stretch')
+                    st.table(preview_df.reset_index(drop=True))
                     st.caption(f"Showing options for 15 strikes closest to spot price (${spot_price:.2f})")
                 
             except Exception as e:
                 st.error(f"❌ Error generating sample data: {str(e)}")
 
+@st.fragment
+def _chart_panel(pipeline_hash: str, gamma_exposures, walls, metrics_summary, current_price: float):
+    """Chart selector and figure; changing the chart type reruns only this fragment"""
+    from visualization.charts import VisualizationError
+    
+    # Chart selection
+    chart_type = st.selectbox(
+        "Select Chart Type",
+        ["Comprehensive Analysis", "Net Gamma Exposure", "Call vs Put Breakdown", "Metrics Summary"],
+        help="Choose the type of chart to display"
+    )
+    
+    try:
+        symbol = st.session_state.get('current_symbol', 'Options')
+        fig = _build_chart(
+            chart_type,
+            pipeline_hash,
+            symbol,
+            (gamma_exposures, walls, metrics_summary, current_price)
+        )
+        
+        st.plotly_chart(fig, width='stretch')
+        
+        # Store chart for export
+        st.session_state.current_chart = fig
+        
+    except VisualizationError as e:
+        st.error(f"❌ Visualization error: {str(e)}")
+
 def render_analysis_section(current_price: float, risk_free_rate: float):
     """Render analysis section with calculations and results"""
     if not st.session_state.data_loaded:
@@ -382,18 +668,20 @@ def render_analysis_section(current_price: float, risk_free_rate: float):
     
     st.header("📈 Gamma Exposure Analysis")
     
+    from calculations.gamma import GammaCalculationError
+    from analysis.walls import WallAnalysisError
+    from analysis.metrics import MetricsCalculationError
+    
     try:
-        # Initialize calculators
-        gamma_calc = GammaCalculator(risk_free_rate=risk_free_rate)
-        wall_analyzer = WallAnalyzer()
-        metrics_calc = MetricsCalculator()
-        viz_engine = VisualizationEngine()
-        
-        # Calculate gamma exposures
+        # Calculate gamma exposures, walls and metrics (cached per chain/price/rate)
         with st.spinner("Calculating gamma exposures..."):
-            gamma_exposures = gamma_calc.aggregate_by_strike(
-                st.session_state.options_contracts, 
-                current_price
+            options_df = st.session_state.options_data
+            data_hash = _options_data_hash(options_df)
+            gamma_exposures, walls, market_metrics, metrics_summary, gamma_environment = _run_analysis_pipeline(
+                data_hash,
+                current_price,
+                risk_free_rate,
+                options_df
             )
             st.session_state.gamma_exposures = gamma_exposures
         
@@ -401,19 +689,10 @@ def render_analysis_section(current_price: float, risk_free_rate: float):
             st.warning("No gamma exposure data calculated. Please check your input data.")
             return
         
-        # Calculate walls
-        with st.spinner("Analyzing gamma walls..."):
-            walls = wall_analyzer.find_all_walls(gamma_exposures, current_price)
-            st.session_state.walls = walls
-        
-        # Calculate metrics
-        with st.spinner("Computing market metrics..."):
-            market_metrics = metrics_calc.calculate_all_metrics(gamma_exposures)
-            metrics_summary = metrics_calc.get_metrics_summary(gamma_exposures, current_price)
-            gamma_environment = metrics_calc.calculate_gamma_environment(gamma_exposures, current_price)
-            st.session_state.market_metrics = market_metrics
-            st.session_state.metrics_summary = metrics_summary
-            st.session_state.gamma_environment = gamma_environment
+        st.session_state.walls = walls
+        st.session_state.market_metrics = market_metrics
+        st.session_state.metrics_summary = metrics_summary
+        st.session_state.gamma_environment = gamma_environment
         
         # Display gamma environment
         st.subheader("🌊 Gamma Environment")
@@ -461,39 +740,18 @@ def render_analysis_section(current_price: float, risk_free_rate: float):
         st.subheader("💪 Environment Strength Analysis")
         strength_info = gamma_env['strength_interpretation']
         
+        strength_md, scale_md = _strength_panel_md(
+            strength_info['level'],
+            strength_info['color'],
+            gamma_env['environment_strength'],
+            strength_info['volatility_impact'],
+            strength_info['description']
+        )
         col1, col2 = st.columns(2)
-        
         with col1:
-            st.write("**Strength Assessment:**")
-            st.write(f"{strength_info['color']} **{strength_info['level']}** ({gamma_env['environment_strength']:.4f})")
-            st.write(f"📊 **Volatility Impact**: {strength_info['volatility_impact']}")
-            st.write(f"📝 {strength_info['description']}")
-            
-            st.write("**How It's Calculated:**")
-            st.code("Strength = |Total Net Gamma| / (Current Price × Total Open Interest)")
-            st.write("This normalizes gamma exposure by market size and price level")
-        
+            st.markdown(strength_md)
         with col2:
-            st.write("**Strength Scale Interpretation:**")
-            st.write("🔴 **Very Strong (≥0.10)**: Dominant market maker forces")
-            st.write("🟠 **Strong (0.05-0.10)**: Significant gamma impact")
-            st.write("🟡 **Moderate (0.02-0.05)**: Noticeable influence")
-            st.write("🟢 **Weak (0.01-0.02)**: Limited impact")
-            st.write("⚪ **Very Weak (<0.01)**: Minimal influence")
-            
-            st.write("**Trading Implications:**")
-            if strength_info['level'] in ['Very Strong', 'Strong']:
-                st.write("• 🎯 **High confidence** in gamma effects")
-                st.write("• 📈 **Strong** support/resistance at walls")
-                st.write("• ⚡ **Significant** volatility changes expected")
-            elif strength_info['level'] == 'Moderate':
-                st.write("• 🎯 **Moderate confidence** in gamma effects")
-                st.write("• 📊 **Noticeable** but not dominant influence")
-                st.write("• 🔄 **Some** volatility impact expected")
-            else:
-                st.write("• ⚠️ **Low confidence** in gamma effects")
-                st.write("• 📉 **Minimal** market maker influence")
-                st.write("• 🎲 **Other factors** likely more important")
+            st.markdown(scale_md)
         
         # Gamma flip level interpretation
         if gamma_env['gamma_flip_level']:
@@ -502,148 +760,70 @@ def render_analysis_section(current_price: float, risk_free_rate: float):
             
             st.subheader("🎯 Gamma Flip Level Analysis")
             
-            if gamma_env['environment'] == 'positive' and flip_distance > 0:
-                st.success(f"**Upside Breakout Scenario** (Current: ${current_price:.0f} → Flip: ${flip_level:.0f})")
-                st.write("**Current Situation:**")
-                st.write("• 🛡️ You're in the **protective zone** of positive gamma")
-                st.write("• 📉 Market makers will **buy dips** and provide support")
-                st.write("• 🔄 **Mean-reverting** price action expected")
-                
-                st.write("**If Price Rises Above Flip Level:**")
-                st.write(f"• ⚡ Environment flips to **negative gamma** above ${flip_level:.0f}")
-                st.write("• 🚀 Market makers become **momentum amplifiers**")
-                st.write("• 📈 **Breakout acceleration** potential")
-                st.write("• 🌪️ **Higher volatility** environment")
-                
-            elif gamma_env['environment'] == 'positive' and flip_distance < 0:
-                st.warning(f"**Downside Risk Scenario** (Current: ${current_price:.0f} → Flip: ${flip_level:.0f})")
-                st.write("**Current Situation:**")
-                st.write("• 🛡️ Still in **positive gamma** territory")
-                st.write("• 📈 Market makers provide **upward support**")
-                
-                st.write("**If Price Falls Below Flip Level:**")
-                st.write(f"• ⚡ Environment becomes **negative gamma** below ${flip_level:.0f}")
-                st.write("• 📉 Market makers would **amplify downward moves**")
-                st.write("• 💥 **Breakdown acceleration** risk")
-                
-            elif gamma_env['environment'] == 'negative' and flip_distance > 0:
-                st.error(f"**Resistance Above** (Current: ${current_price:.0f} → Flip: ${flip_level:.0f})")
-                st.write("**Current Situation:**")
-                st.write("• ⚡ You're in **negative gamma** territory")
-                st.write("• 📈 Market makers **amplify moves** upward")
-                
-                st.write("**If Price Rises Above Flip Level:**")
-                st.write(f"• 🛡️ Environment becomes **positive gamma** above ${flip_level:.0f}")
-                st.write("• 🔄 Market makers would provide **stabilization**")
-                st.write("• 📊 **Lower volatility** expected")
-                
-            elif gamma_env['environment'] == 'negative' and flip_distance < 0:
-                st.error(f"**Support Below** (Current: ${current_price:.0f} → Flip: ${flip_level:.0f})")
-                st.write("**Current Situation:**")
-                st.write("• ⚡ You're in **negative gamma** territory")
-                st.write("• 📉 Market makers **amplify moves** downward")
-                
-                st.write("**If Price Falls Below Flip Level:**")
-                st.write(f"• 🛡️ Environment becomes **positive gamma** below ${flip_level:.0f}")
-                st.write("• 🔄 Market makers would provide **support**")
-                st.write("• 📊 **Stabilization** expected")
+            flip_panel = _flip_panel_md(gamma_env['environment'], int(np.sign(flip_distance)), current_price, flip_level)
+            if flip_panel is not None:
+                alert_kind, headline, body_md = flip_panel
+                getattr(st, alert_kind)(headline)
+                st.markdown(body_md)
         
-        # Strike distribution
+        # Strike distribution and market implications
+        distribution_md, implications_md = _distribution_panel_md(
+            gamma_env['environment'],
+            gamma_env['positive_strikes'],
+            gamma_env['positive_strike_percentage'],
+            gamma_env['negative_strikes'],
+            gamma_env['negative_strike_percentage'],
+            gamma_env['neutral_strikes']
+        )
         col1, col2 = st.columns(2)
         with col1:
-            st.write("**Strike Distribution:**")
-            st.write(f"• Positive Gamma Strikes: {gamma_env['positive_strikes']} ({gamma_env['positive_strike_percentage']:.1f}%)")
-            st.write(f"• Negative Gamma Strikes: {gamma_env['negative_strikes']} ({gamma_env['negative_strike_percentage']:.1f}%)")
-            st.write(f"• Neutral Strikes: {gamma_env['neutral_strikes']}")
-        
+            st.markdown(distribution_md)
         with col2:
-            # Environment implications
-            st.write("**Market Implications:**")
-            if gamma_env['environment'] == 'positive':
-                st.write("• 🛡️ Market makers provide **stabilizing** force")
-                st.write("• 📉 **Buy dips**, sell rallies")
-                st.write("• 🔄 **Lower volatility** environment")
-                st.write("• 💪 **Support** at key levels")
-            elif gamma_env['environment'] == 'negative':
-                st.write("• ⚡ Market makers **amplify** moves")
-                st.write("• 📈 **Sell dips**, buy rallies")
-                st.write("• 🌪️ **Higher volatility** environment")
-                st.write("• 💥 **Momentum** acceleration")
-            else:
-                st.write("• ⚖️ **Balanced** gamma exposure")
-                st.write("• 🎯 **Mixed** market maker flows")
-                st.write("• 📊 **Moderate** volatility expected")
-
+            st.markdown(implications_md)
+        
         # Display key metrics
         st.subheader("🎯 Key Metrics")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                "Total Net Gamma",
-                f"{market_metrics.total_net_gamma:,.0f}",
-                help="Total net gamma exposure across all strikes"
-            )
-        
-        with col2:
-            st.metric(
-                "Weighted Avg Strike",
-                f"{market_metrics.gamma_weighted_avg_strike:.0f}",
-                help="Gamma-weighted average strike price"
-            )
-        
-        with col3:
-            st.metric(
-                "Call/Put Ratio",
-                f"{market_metrics.call_put_gamma_ratio:.2f}",
-                help="Ratio of call to put gamma exposure"
-            )
-        
-        with col4:
-            total_walls = len(walls['call_walls']) + len(walls['put_walls'])
-            st.metric(
-                "Total Walls",
-                total_walls,
-                help="Number of identified gamma walls"
-            )
+        _metric_row([
+            dict(label="Total Net Gamma",
+                 value=f"{market_metrics.total_net_gamma:,.0f}",
+                 help="Total net gamma exposure across all strikes"),
+            dict(label="Weighted Avg Strike",
+                 value=f"{market_metrics.gamma_weighted_avg_strike:.0f}",
+                 help="Gamma-weighted average strike price"),
+            dict(label="Call/Put Ratio",
+                 value=f"{market_metrics.call_put_gamma_ratio:.2f}",
+                 help="Ratio of call to put gamma exposure"),
+            dict(label="Total Walls",
+                 value=len(walls['call_walls']) + len(walls['put_walls']),
+                 help="Number of identified gamma walls")
+        ])
         
         # Expected Move Section
         st.subheader("📏 Expected Move (Based on Implied Volatility)")
         
-        # Calculate average IV from options data
-        if st.session_state.options_contracts:
+        # Calculate average IV from options data (column reductions, no per-contract loop)
+        if not options_df.empty:
             import math
-            from datetime import datetime
             
             # Find ATM (At-The-Money) IV for more accurate expected move
             # ATM options have strikes closest to current price
-            contracts_with_distance = []
-            for c in st.session_state.options_contracts:
-                distance = abs(c.strike - current_price)
-                contracts_with_distance.append((c, distance))
-            
-            # Sort by distance from current price
-            contracts_with_distance.sort(key=lambda x: x[1])
+            distance = np.abs(options_df['strike'].to_numpy(dtype=np.float64) - current_price)
+            implied_vols = options_df['implied_volatility'].to_numpy(dtype=np.float64)
             
             # Use ATM IV (average of closest 10 contracts, or all if less than 10)
-            atm_contracts = [c for c, _ in contracts_with_distance[:min(10, len(contracts_with_distance))]]
-            avg_iv = sum(c.implied_volatility for c in atm_contracts) / len(atm_contracts)
+            atm_idx = np.argsort(distance, kind='stable')[:10]
+            avg_iv = float(implied_vols[atm_idx].mean())
             
             # Also calculate overall average for comparison
-            overall_avg_iv = sum(c.implied_volatility for c in st.session_state.options_contracts) / len(st.session_state.options_contracts)
+            overall_avg_iv = float(implied_vols.mean())
             
-            # Calculate days to expiry for each contract
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            days_to_expiry_list = []
-            for c in st.session_state.options_contracts:
-                expiry = c.expiry_date if isinstance(c.expiry_date, datetime) else datetime.fromisoformat(str(c.expiry_date))
-                # Normalize expiry to midnight if it has time component
-                expiry = expiry.replace(hour=0, minute=0, second=0, microsecond=0)
-                dte = max(1, (expiry - today).days)
-                days_to_expiry_list.append(dte)
+            # Calculate days to expiry for each contract, normalizing expiries to midnight
+            today = pd.Timestamp.now().normalize()
+            expiries = pd.to_datetime(options_df['expiry_date']).dt.normalize()
+            days_to_expiry = (expiries - today).dt.days.clip(lower=1)
             
             # Get average days to expiry
-            avg_dte = sum(days_to_expiry_list) / len(days_to_expiry_list)
+            avg_dte = float(days_to_expiry.mean())
             
             # Calculate expected move
             time_factor = math.sqrt(avg_dte / 365)
@@ -741,43 +921,9 @@ def render_analysis_section(current_price: float, risk_free_rate: float):
         # Create and display charts
         st.subheader("📊 Visualizations")
         
-        # Chart selection
-        chart_type = st.selectbox(
-            "Select Chart Type",
-            ["Comprehensive Analysis", "Net Gamma Exposure", "Call vs Put Breakdown", "Metrics Summary"],
-            help="Choose the type of chart to display"
-        )
-        
-        try:
-            if chart_type == "Comprehensive Analysis":
-                symbol = st.session_state.get('current_symbol', 'Options')
-                fig = viz_engine.create_comprehensive_chart(
-                    gamma_exposures, walls, current_price,
-                    f"{symbol} Gamma Exposure with Walls"
-                )
-            elif chart_type == "Net Gamma Exposure":
-                fig = viz_engine.create_gamma_exposure_chart(
-                    gamma_exposures, current_price,
-                    "Net Gamma Exposure by Strike"
-                )
-            elif chart_type == "Call vs Put Breakdown":
-                fig = viz_engine.create_call_put_breakdown_chart(
-                    gamma_exposures, current_price,
-                    "Call vs Put Gamma Exposure"
-                )
-            elif chart_type == "Metrics Summary":
-                fig = viz_engine.create_metrics_summary_chart(
-                    metrics_summary,
-                    "Gamma Exposure Metrics Dashboard"
-                )
-            
-            st.plotly_chart(fig, width='stretch')
-            
-            # Store chart for export
-            st.session_state.current_chart = fig
-            
-        except VisualizationError as e:
-            st.error(f"❌ Visualization error: {str(e)}")
+        pipeline_hash = f"{data_hash}:{current_price}:{risk_free_rate}"
+        st.session_state.pipeline_hash = pipeline_hash
+        _chart_panel(pipeline_hash, gamma_exposures, walls, metrics_summary, current_price)
         
     except (GammaCalculationError, WallAnalysisError, MetricsCalculationError) as e:
         st.error(f"❌ Calculation error: {str(e)}")
@@ -1229,64 +1375,76 @@ def render_neutral_gamma_strategies(current_price: float, gamma_env: dict, walls
                 st.markdown("- Prepare strategy adjustments")
                 st.markdown("- Increase monitoring near this level")
 
+@st.cache_data(show_spinner=False, ttl=300, max_entries=32)
+def _export_csv_bytes(kind: str, pipeline_hash: str, _data) -> bytes:
+    """Serialize gamma exposures or walls to CSV once per pipeline run"""
+    from ui.export import ExportManager
+    
+    export_manager = ExportManager()
+    if kind == "gamma":
+        csv_data = export_manager.export_gamma_exposures_to_csv(_data)
+    else:
+        csv_data = export_manager.export_walls_to_csv(_data)
+    return csv_data.encode('utf-8')
+
+@st.fragment
+def _download_panel(pipeline_hash: str):
+    """Download buttons; clicks rerun only this fragment"""
+    file_stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.subheader("📊 Data Export")
+        
+        # Bytes are ready at render time, so one click downloads without an extra rerun
+        st.download_button(
+            label="📈 Download Gamma Data (CSV)",
+            data=_export_csv_bytes("gamma", pipeline_hash, st.session_state.gamma_exposures),
+            file_name=f"gamma_exposures_{file_stamp}.csv",
+            mime="text/csv"
+        )
+    
+    with col2:
+        st.subheader("🧱 Walls Export")
+        
+        walls = st.session_state.walls
+        if walls and (walls.get('call_walls') or walls.get('put_walls')):
+            st.download_button(
+                label="🏗️ Download Walls (CSV)",
+                data=_export_csv_bytes("walls", pipeline_hash, walls),
+                file_name=f"walls_{file_stamp}.csv",
+                mime="text/csv"
+            )
+    
+    with col3:
+        st.subheader("📊 Chart Export")
+        
+        if hasattr(st.session_state, 'current_chart') and st.button("🖼️ Download Chart (PNG)", type="secondary"):
+            # Note: PNG export requires kaleido package
+            st.info("Chart export feature requires additional setup. Use browser's save image option for now.")
+
 def render_export_section():
     """Render export section"""
-    # COMMENTED OUT - Export functionality disabled
-    pass
-    # if not st.session_state.data_loaded or not st.session_state.gamma_exposures:
-    #     return
-    # 
-    # st.header("💾 Export Data")
-    # 
-    # try:
-    #     export_manager = ExportManager()
-    #     
-    #     col1, col2, col3 = st.columns(3)
-    #     
-    #     with col1:
-    #         st.subheader("📊 Data Export")
-    #         
-    #         # Export gamma exposures
-    #         if st.button("📈 Download Gamma Data (CSV)", type="secondary"):
-    #             csv_data = export_manager.export_gamma_exposures_to_csv(
-    #                 st.session_state.gamma_exposures
-    #             )
-    #             st.download_button(
-    #                 label="💾 Download CSV",
-    #                 data=csv_data,
-    #                 file_name=f"gamma_exposures_{export_manager.get_export_timestamp().replace(':', '-').replace(' ', '_')}.csv",
-    #                 mime="text/csv"
-    #             )
-    #     
-    #     with col2:
-    #         st.subheader("🧱 Walls Export")
-    #         
-    #         if st.session_state.walls and st.button("🏗️ Download Walls (CSV)", type="secondary"):
-    #             csv_data = export_manager.export_walls_to_csv(st.session_state.walls)
-    #             st.download_button(
-    #                 label="💾 Download CSV",
-    #                 data=csv_data,
-    #                 file_name=f"walls_{export_manager.get_export_timestamp().replace(':', '-').replace(' ', '_')}.csv",
-    #                 mime="text/csv"
-    #             )
-    #     
-    #     with col3:
-    #         st.subheader("📊 Chart Export")
-    #         
-    #         if hasattr(st.session_state, 'current_chart') and st.button("🖼️ Download Chart (PNG)", type="secondary"):
-    #             try:
-    #                 # Note: PNG export requires kaleido package
-    #                 st.info("Chart export feature requires additional setup. Use browser's save image option for now.")
-    #             except Exception as e:
-    #                 st.error(f"Chart export error: {str(e)}")
-    #     
-    #     # Comprehensive export
-    #     st.subheader("📦 Complete Package")
-    #     if st.button("📦 Download Complete Analysis Package", type="primary"):
-    #         st.info("Complete package export would include all data, metrics, and charts. Feature in development.")
-    # 
-    # except ExportError as e:
-    #     st.error(f"❌ Export error: {str(e)}")
+    if not st.session_state.data_loaded or not st.session_state.gamma_exposures:
+        return
+    if 'pipeline_hash' not in st.session_state:
+        return
+    
+    from ui.export import ExportError
+    
+    st.header("💾 Export Data")
+    
+    try:
+        _download_panel(st.session_state.pipeline_hash)
+        
+        # Comprehensive export
+        st.subheader("📦 Complete Package")
+        if st.button("📦 Download Complete Analysis Package", type="primary"):
+            st.info("Complete package export would include all data, metrics, and charts. Feature in development.")
+    
+    except ExportError as e:
+        st.error(f"❌ Export error: {str(e)}")
 
 def main():
     """Main application function"""
@@ -15,9 +15,23 @@ CURRENT_PRICE_COLOR = '#FFE66D'
 # File upload limits
 MAX_FILE_SIZE_MB = 50
 SUPPORTED_FILE_TYPES = ['csv', 'xlsx', 'xls']
+CSV_CHUNK_ROWS = 100_000  # Rows per chunk for CSV files over half of MAX_FILE_SIZE_MB
+
+# Yahoo Finance fetching
+YF_MAX_CONCURRENT_REQUESTS = 5  # Parallel option_chain requests per fetch, kept low for Yahoo rate limits
+YF_PRICE_BATCH_SIZE = 20       # Symbols per batched price download
+YF_REQUESTS_PER_SECOND = 10    # Process-wide cap on Yahoo requests (token bucket, also the burst size)
+PRICE_CACHE_TTL = 30          # Seconds a fetched underlying price is reused
+EXPIRATIONS_CACHE_TTL = 300   # Seconds a fetched expiration list is reused
+TICKER_CACHE_TTL = 30         # Seconds a fetcher reuses a yf.Ticker (and the data it holds)
+DOWNLOAD_CACHE_TTL = 300      # Seconds download_options.py reuses a downloaded chain
 
 # Calculation parameters
 MIN_TIME_TO_EXPIRY = 1/365.25  # 1 day minimum (accounts for leap years)
 MAX_TIME_TO_EXPIRY = 5.0       # 5 years maximum
 MIN_VOLATILITY = 0.01       # 1% minimum
-MAX_VOLATILITY = 2.0        # 200% maximum
\ No newline at end of file
+MAX_VOLATILITY = 2.0        # 200% maximum
+
+# Numeric constants used by the gamma kernels
+INV_SQRT_2PI = 0.3989422804014327          # 1 / sqrt(2 * pi), normal pdf scale
+YEARS_PER_NS = 1.0 / (365.25 * 24 * 3600 * 1e9)  # 365.25-day year, in nanoseconds
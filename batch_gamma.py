@@ -5,42 +5,69 @@ Usage: python batch_gamma.py [symbol1] [symbol2] ...
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from data.yfinance_fetcher import YFinanceOptionsFetcher
+from data.cache import cached
 from calculations.gamma import GammaCalculator
 from analysis.walls import WallAnalyzer
 from analysis.metrics import MetricsCalculator
 
 
+@cached(ttl=300)
+def _current_price(fetcher, symbol: str) -> float:
+    """Current price, cached on disk for 5 minutes"""
+    return fetcher.get_current_price(symbol)
+
+
+def _prefetch_prices(fetcher, symbols):
+    """Price the symbols without a fresh cached price in one batched request and cache the results"""
+    stale = [symbol for symbol in symbols if _current_price.peek(fetcher, symbol) is None]
+    if not stale:
+        return
+    for symbol, price in fetcher.get_current_prices(stale).items():
+        _current_price.seed(price, fetcher, symbol)
+
+
+@cached(ttl=3600)
+def _expiration_dates(fetcher, symbol: str):
+    """Available expirations, cached on disk for 1 hour"""
+    return fetcher.get_expiration_dates(symbol)
+
+
+@cached(ttl=3600)
+def _options_chain(fetcher, symbol: str, expiration_date, include_all_expirations: bool):
+    """Options chain, cached on disk for 1 hour"""
+    return fetcher.fetch_options_chain(
+        symbol,
+        expiration_date=expiration_date,
+        include_all_expirations=include_all_expirations
+    )
+
+
 def analyze_symbol(symbol: str, expiration: str, fetcher, calculator, wall_analyzer, metrics_calc):
     """Analyze a single symbol"""
     try:
         # Fetch data
-        current_price = fetcher.get_current_price(symbol)
+        current_price = _current_price(fetcher, symbol)
         
         # Handle expiration
         selected_expiration = None
         include_all = False
         
         if expiration and expiration != 'nearest':
-            expirations = fetcher.get_expiration_dates(symbol)
+            expirations = _expiration_dates(fetcher, symbol)
             if expiration in expirations:
                 selected_expiration = expiration
             elif expiration == 'multiple':
                 include_all = True
         
-        options_df = fetcher.fetch_options_chain(
-            symbol,
-            expiration_date=selected_expiration,
-            include_all_expirations=include_all
-        )
-        contracts = fetcher.convert_to_contracts(options_df)
-        
-        if not contracts:
+        options_df = _options_chain(fetcher, symbol, selected_expiration, include_all)
+        if options_df.empty:
             return None
         
-        # Calculate
-        gamma_exposures = calculator.aggregate_by_strike(contracts, current_price)
+        # Calculate straight from the DataFrame columns (no OptionsContract round-trip)
+        gamma_exposures = calculator.aggregate_by_strike_df(options_df, current_price)
         walls = wall_analyzer.find_all_walls(gamma_exposures, current_price)
         market_metrics = metrics_calc.calculate_all_metrics(gamma_exposures)
         gamma_env = metrics_calc.calculate_gamma_environment(gamma_exposures, current_price)
@@ -48,7 +75,7 @@ def analyze_symbol(symbol: str, expiration: str, fetcher, calculator, wall_analy
         return {
             'symbol': symbol,
             'price': current_price,
-            'contracts': len(contracts),
+            'contracts': len(options_df),
             'environment': gamma_env['environment'],
             'strength': gamma_env['strength_interpretation']['level'],
             'net_gamma': market_metrics.total_net_gamma,
@@ -102,14 +129,24 @@ def main():
     wall_analyzer = WallAnalyzer()
     metrics_calc = MetricsCalculator()
     
-    results = []
+    # Price the symbols missing from the disk cache in one batched request;
+    # the per-symbol lookups below then all hit the cache
+    _prefetch_prices(fetcher, symbols)
+    
+    # Analyze symbols concurrently - each one is dominated by network I/O.
+    # The fetcher and calculators hold no per-call state, so they are shared.
+    by_symbol = {}
+    with ThreadPoolExecutor(max_workers=min(10, len(symbols))) as executor:
+        futures = {}
+        for symbol in symbols:
+            print(f"\n📊 Analyzing {symbol}...")
+            futures[executor.submit(analyze_symbol, symbol, expiration, fetcher,
+                                    calculator, wall_analyzer, metrics_calc)] = symbol
+        for future in as_completed(futures):
+            by_symbol[futures[future]] = future.result()
     
-    # Analyze each symbol
-    for symbol in symbols:
-        print(f"\n📊 Analyzing {symbol}...")
-        result = analyze_symbol(symbol, expiration, fetcher, calculator, wall_analyzer, metrics_calc)
-        if result:
-            results.append(result)
+    # Keep the command-line order in the report
+    results = [by_symbol[symbol] for symbol in symbols if by_symbol.get(symbol)]
     
     # Display results table
     print("\n" + "=" * 80)
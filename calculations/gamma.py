@@ -2,15 +2,186 @@
 Gamma calculation using Black-Scholes model
 """
 
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 import numpy as np
 import pandas as pd
-from scipy.stats import norm
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from data.models import OptionsContract, GammaExposure
 from app_config import SPX_CONTRACT_MULTIPLIER, DEFAULT_RISK_FREE_RATE, DEFAULT_VOLATILITY
 from app_config import MIN_TIME_TO_EXPIRY, MAX_TIME_TO_EXPIRY, MIN_VOLATILITY, MAX_VOLATILITY
+from app_config import INV_SQRT_2PI, YEARS_PER_NS
+
+# Numba is optional: the strike-bucket kernel falls back to NumPy without it
+try:
+    from numba import njit, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# NumExpr is optional: large gamma arrays are evaluated in one fused, multi-threaded pass
+try:
+    import numexpr as ne
+    ne.set_num_threads(ne.detect_number_of_cores())
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Below this many contracts NumExpr's per-call setup costs more than it saves
+NUMEXPR_MIN_SIZE = 4096
+
+# Chains kept by a memoizing GammaCalculator before the oldest is evicted
+MEMO_MAX_ENTRIES = 256
+
+# vol_sqrt_t is passed in precomputed: NumExpr does not eliminate repeated subexpressions
+_GAMMA_EXPR = (
+    "exp(-0.5 * ((log(spot / strikes) + (r + 0.5 * vol * vol) * t) / vol_sqrt_t)**2)"
+    " * inv_sqrt_2pi / (spot * vol_sqrt_t)"
+)
+
+# Gamma times spot, for the exposure kernels (see _gamma_times_spot)
+_GAMMA_SPOT_EXPR = (
+    "exp(-0.5 * ((log(spot / strikes) + (r + 0.5 * vol * vol) * t) / vol_sqrt_t)**2)"
+    " * inv_sqrt_2pi / vol_sqrt_t"
+)
+
+
+if NUMBA_AVAILABLE:
+    # Serial 'cpu' target for the same threading reasons as the strike-bucket kernel below
+    @vectorize(['f8(f8, f8, f8, f8, f8)', 'f4(f4, f4, f4, f4, f4)'], cache=True)
+    def bs_gamma(spot, strike, time_to_expiry, volatility, risk_free_rate):
+        """Black-Scholes gamma as a ufunc: scalars or broadcast arrays, no input checks"""
+        vol_sqrt_t = volatility * math.sqrt(time_to_expiry)
+        d1 = (math.log(spot / strike) + (risk_free_rate + 0.5 * volatility * volatility) * time_to_expiry) / vol_sqrt_t
+        return INV_SQRT_2PI * math.exp(-0.5 * d1 * d1) / (spot * vol_sqrt_t)
+else:
+    def bs_gamma(spot, strike, time_to_expiry, volatility, risk_free_rate):
+        """Black-Scholes gamma for scalars or broadcast arrays, no input checks"""
+        vol_sqrt_t = volatility * np.sqrt(time_to_expiry)
+        d1 = (np.log(spot / strike) + (risk_free_rate + 0.5 * volatility * volatility) * time_to_expiry) / vol_sqrt_t
+        return np.exp(-0.5 * d1 * d1) * INV_SQRT_2PI / (spot * vol_sqrt_t)
+
+
+def _gamma_vec(spot, strikes, time_to_expiry, volatility, risk_free_rate):
+    """Black-Scholes gamma over arrays, with the normal pdf written out in closed form"""
+    if NUMEXPR_AVAILABLE and np.size(strikes) >= NUMEXPR_MIN_SIZE:
+        return ne.evaluate(_GAMMA_EXPR, local_dict={
+            'spot': spot,
+            'strikes': strikes,
+            't': time_to_expiry,
+            'vol': volatility,
+            'vol_sqrt_t': volatility * np.sqrt(time_to_expiry),
+            'r': risk_free_rate,
+            'inv_sqrt_2pi': INV_SQRT_2PI
+        })
+    
+    return bs_gamma(spot, strikes, time_to_expiry, volatility, risk_free_rate)
+
+
+def _gamma_times_spot(spot, strikes, time_to_expiry, volatility, risk_free_rate):
+    """
+    Black-Scholes gamma multiplied by spot, over arrays
+    
+    gamma = pdf(d1) / (spot * vol * sqrt(T)) and exposure = gamma * OI * multiplier * spot,
+    so spot cancels: exposure = pdf(d1) / (vol * sqrt(T)) * OI * multiplier. The exposure
+    kernels use this form and never divide by spot only to multiply by it again.
+    """
+    vol_sqrt_t = volatility * np.sqrt(time_to_expiry)
+    if NUMEXPR_AVAILABLE and np.size(strikes) >= NUMEXPR_MIN_SIZE:
+        return ne.evaluate(_GAMMA_SPOT_EXPR, local_dict={
+            'spot': spot,
+            'strikes': strikes,
+            't': time_to_expiry,
+            'vol': volatility,
+            'vol_sqrt_t': vol_sqrt_t,
+            'r': risk_free_rate,
+            'inv_sqrt_2pi': INV_SQRT_2PI
+        })
+    
+    d1 = (np.log(spot / strikes) + (risk_free_rate + 0.5 * volatility * volatility) * time_to_expiry) / vol_sqrt_t
+    return np.exp(-0.5 * d1 * d1) * INV_SQRT_2PI / vol_sqrt_t
+
+
+@lru_cache(maxsize=4096)
+def _time_to_expiry_years(expiry_date, current_date):
+    """Scalar clamped time to expiry, memoized: a chain repeats a few expiries across many contracts"""
+    time_diff = (expiry_date - current_date).total_seconds() / (365.25 * 24 * 3600)
+    return max(MIN_TIME_TO_EXPIRY, min(MAX_TIME_TO_EXPIRY, time_diff))
+
+
+def _years_to_expiry(expiries, current_date):
+    """Clamped times to expiry in years for a datetime64 array, computed on int64 nanoseconds"""
+    expiry_ns = np.asarray(expiries, dtype='datetime64[ns]').view(np.int64)
+    now_ns = np.datetime64(current_date, 'ns').astype(np.int64)
+    return np.clip((expiry_ns - now_ns) * YEARS_PER_NS, MIN_TIME_TO_EXPIRY, MAX_TIME_TO_EXPIRY)
+
+
+def _sanitize(arr):
+    """Zero the non-finite entries of a float array in place and return the mask of finite ones"""
+    finite = np.isfinite(arr)
+    arr[~finite] = 0.0
+    return finite
+
+
+def _strike_bucket_exposure_numpy(bucket_idx, n_buckets, strikes, time_to_expiry, volatility,
+                                  open_interest, is_call, spot, risk_free_rate, contract_multiplier):
+    """NumPy version of the per-contract gamma exposure and strike-bucket sums"""
+    # Overflow or 0/0 just yields inf/NaN here; those are counted and zeroed below
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        exposure = _gamma_times_spot(spot, strikes, time_to_expiry, volatility, risk_free_rate) * open_interest * contract_multiplier
+    
+    # Contracts whose gamma is not finite are dropped from the sums but keep their strike
+    finite = _sanitize(exposure)
+    
+    # One bincount over (strike, side) pairs: column 0 sums puts, column 1 sums calls
+    side_sums = np.bincount(bucket_idx * 2 + is_call, weights=exposure, minlength=2 * n_buckets).reshape(n_buckets, 2)
+    call_exposure = -side_sums[:, 1]
+    put_exposure = side_sums[:, 0]
+    total_oi = np.bincount(bucket_idx, weights=np.where(finite, open_interest, 0.0), minlength=n_buckets)
+    return call_exposure, put_exposure, total_oi, int((~finite).sum())
+
+
+if NUMBA_AVAILABLE:
+    # No 'nnan'/'ninf' fast-math flags: the kernel relies on detecting non-finite gammas.
+    # Not parallel: Streamlit runs scripts on worker threads, and Numba's threading
+    # layers either hang at interpreter exit or are unsafe for concurrent callers there.
+    @njit(cache=True, fastmath={'arcp', 'contract', 'afn'})
+    def _strike_bucket_exposure_numba(bucket_idx, n_buckets, strikes, time_to_expiry, volatility,
+                                      open_interest, is_call, spot, risk_free_rate, contract_multiplier):
+        """Numba version of the per-contract gamma exposure and strike-bucket sums"""
+        # Column 0 sums puts, column 1 sums calls, so the side is an index rather than a branch
+        side_sums = np.zeros((n_buckets, 2))
+        total_oi = np.zeros(n_buckets)
+        non_finite = 0
+        
+        # Gamma, exposure and the bucket add happen in one pass, with no per-contract temporaries
+        for i in range(strikes.shape[0]):
+            vol = volatility[i]
+            t = time_to_expiry[i]
+            vol_sqrt_t = vol * math.sqrt(t)
+            d1 = (math.log(spot / strikes[i]) + (risk_free_rate + 0.5 * vol * vol) * t) / vol_sqrt_t
+            # Gamma times spot: the spot in gamma's denominator cancels the one in exposure
+            gamma_spot = math.exp(-0.5 * d1 * d1) * INV_SQRT_2PI / vol_sqrt_t
+            exposure = gamma_spot * open_interest[i] * contract_multiplier
+            
+            if not math.isfinite(exposure):
+                non_finite += 1
+                continue
+            bucket = bucket_idx[i]
+            side_sums[bucket, np.int64(is_call[i])] += exposure
+            total_oi[bucket] += open_interest[i]
+        
+        # Calls carry the negative sign (market makers short calls)
+        return -side_sums[:, 1], side_sums[:, 0].copy(), total_oi, non_finite
+    
+    _strike_bucket_exposure = _strike_bucket_exposure_numba
+else:
+    _strike_bucket_exposure = _strike_bucket_exposure_numpy
 
 
 class GammaCalculationError(Exception):
@@ -24,7 +195,9 @@ class GammaCalculator:
     def __init__(self, 
                  risk_free_rate: float = DEFAULT_RISK_FREE_RATE,
                  contract_multiplier: int = SPX_CONTRACT_MULTIPLIER,
-                 debug: bool = False):
+                 debug: bool = False,
+                 memoize: bool = False,
+                 dtype=np.float64):
         """
         Initialize gamma calculator
         
@@ -32,10 +205,20 @@ class GammaCalculator:
             risk_free_rate: Risk-free interest rate (default from config)
             contract_multiplier: Contract multiplier for exposure calculation
             debug: Enable debug mode for detailed variable printing
+            memoize: Reuse strike aggregations for identical chains and spot
+                (ignored in debug mode). "Now" is then taken at minute resolution.
+            dtype: Float precision of the per-contract gamma kernel. np.float32
+                halves memory traffic on very large chains; strike sums are
+                always accumulated in float64.
         """
         self.risk_free_rate = risk_free_rate
         self.contract_multiplier = contract_multiplier
         self.debug = debug
+        self.dtype = np.dtype(dtype)
+        # Pick the exposure implementation once instead of testing self.debug per contract
+        self._calc_exp = self._exposure_debug if debug else self._exposure_fast
+        self._memo = OrderedDict() if memoize and not debug else None
+        self._memo_lock = threading.Lock()
         self.validate_parameters()
     
     def validate_parameters(self):
@@ -44,6 +227,8 @@ class GammaCalculator:
             raise GammaCalculationError(f"Risk-free rate must be between 0 and 1: {self.risk_free_rate}")
         if self.contract_multiplier <= 0:
             raise GammaCalculationError(f"Contract multiplier must be positive: {self.contract_multiplier}")
+        if self.dtype not in (np.float32, np.float64):
+            raise GammaCalculationError(f"Kernel dtype must be float32 or float64: {self.dtype}")
     
     def calculate_time_to_expiry(self, expiry_date: datetime, current_date: Optional[datetime] = None) -> float:
         """
@@ -61,17 +246,10 @@ class GammaCalculator:
             - Expired options are clamped to MIN_TIME_TO_EXPIRY (1 day)
             - Very long-dated options are clamped to MAX_TIME_TO_EXPIRY (5 years)
             - Provides intraday precision using total_seconds()
+            - When current_date is omitted, "now" is resolved like the vectorized
+              path: truncated to the minute only when memoize is on
         """
-        if current_date is None:
-            current_date = datetime.now()
-        
-        # Calculate precise time difference in years
-        time_diff = (expiry_date - current_date).total_seconds() / (365.25 * 24 * 3600)
-        
-        # Apply bounds to prevent extreme values
-        time_to_expiry = max(MIN_TIME_TO_EXPIRY, min(MAX_TIME_TO_EXPIRY, time_diff))
-        
-        return time_to_expiry
+        return _time_to_expiry_years(expiry_date, self._valuation_time(current_date))
     
     def calculate_gamma(self, 
                        spot: float, 
@@ -93,9 +271,9 @@ class GammaCalculator:
             Gamma value
         """
         # Validate inputs
-        if spot <= 0:
+        if not 0 < spot < math.inf:
             raise GammaCalculationError(f"Spot price must be positive: {spot}")
-        if strike <= 0:
+        if not 0 < strike < math.inf:
             raise GammaCalculationError(f"Strike price must be positive: {strike}")
         if time_to_expiry <= 0:
             raise GammaCalculationError(f"Time to expiry must be positive: {time_to_expiry}")
@@ -104,24 +282,50 @@ class GammaCalculator:
         if option_type not in ['call', 'put']:
             raise GammaCalculationError(f"Option type must be 'call' or 'put': {option_type}")
         
-        try:
-            # Black-Scholes gamma calculation
-            d1 = (np.log(spot / strike) + (self.risk_free_rate + 0.5 * volatility**2) * time_to_expiry) / (volatility * np.sqrt(time_to_expiry))
-            
-            # Gamma is the same for calls and puts
-            gamma = norm.pdf(d1) / (spot * volatility * np.sqrt(time_to_expiry))
-            
-            # Handle numerical issues
-            if np.isnan(gamma) or np.isinf(gamma):
-                raise GammaCalculationError("Gamma calculation resulted in NaN or infinity")
-            
-            return float(gamma)
+        # Validated inputs keep log/sqrt/exp in their domains, so only non-finite results need handling
+        gamma = self._calc_gamma_fast(spot, strike, time_to_expiry, volatility)
+        if not math.isfinite(gamma):
+            raise GammaCalculationError("Gamma calculation resulted in NaN or infinity")
+        
+        return float(gamma)
+    
+    def _calc_gamma_fast(self, spot: float, strike: float, time_to_expiry: float, volatility: float) -> float:
+        """Black-Scholes gamma with no input checks; callers must validate first"""
+        # One division: 1 / (vol * sqrt(T)) serves both d1 and the gamma denominator
+        inv_vol_sqrt_t = 1.0 / (volatility * math.sqrt(time_to_expiry))
+        d1 = (math.log(spot / strike) + (self.risk_free_rate + 0.5 * volatility * volatility) * time_to_expiry) * inv_vol_sqrt_t
+        
+        # Gamma is the same for calls and puts (normal pdf in closed form)
+        return INV_SQRT_2PI * math.exp(-0.5 * d1 * d1) * inv_vol_sqrt_t / spot
+    
+    def calculate_gamma_vec(self, 
+                           spot: float, 
+                           strikes: np.ndarray, 
+                           time_to_expiry: np.ndarray, 
+                           volatility: np.ndarray) -> np.ndarray:
+        """
+        Calculate Black-Scholes gamma for many contracts at once
+        
+        Array version of calculate_gamma. Inputs are not validated here;
+        callers apply the same bounds as the scalar path, and non-finite
+        results are returned as-is for the caller to handle.
+        
+        Args:
+            spot: Current underlying price
+            strikes: Strike prices
+            time_to_expiry: Times to expiry in years
+            volatility: Implied volatilities
             
-        except Exception as e:
-            if isinstance(e, GammaCalculationError):
-                raise
-            else:
-                raise GammaCalculationError(f"Error calculating gamma: {str(e)}")
+        Returns:
+            Array of gamma values
+        """
+        return _gamma_vec(
+            spot,
+            np.asarray(strikes, dtype=np.float64),
+            np.asarray(time_to_expiry, dtype=np.float64),
+            np.asarray(volatility, dtype=np.float64),
+            self.risk_free_rate
+        )
     
     def calculate_exposure(self, 
                           gamma: float, 
@@ -147,34 +351,39 @@ class GammaCalculator:
         if spot <= 0:
             raise GammaCalculationError(f"Spot price must be positive: {spot}")
         
-        if self.debug and strike is not None:
-            print(f"\n  DEBUG: calculate_exposure() for {option_type.upper()} at strike {strike}")
-            print(f"    gamma                = {gamma:>20.10f}")
-            print(f"    open_interest        = {open_interest:>20,}")
-            print(f"    contract_multiplier  = {self.contract_multiplier:>20,}")
-            print(f"    spot                 = {spot:>20.2f}")
-            print(f"    raw_exposure         = {gamma * open_interest * self.contract_multiplier * spot:>20,.2f}")
-        
-        # Basic exposure calculation
+        return self._calc_exp(gamma, open_interest, spot, option_type, strike)
+    
+    def _exposure_fast(self, gamma: float, open_interest: int, spot: float,
+                       option_type: str, strike: float = None) -> float:
+        """calculate_exposure without debug output"""
         exposure = gamma * open_interest * self.contract_multiplier * spot
         
         # Apply sign convention: 
         # - Market makers are typically short options, so they have opposite gamma exposure
         # - When MM are short calls, they have negative gamma (need to buy as price rises)
         # - When MM are short puts, they have positive gamma (need to sell as price falls)
+        return float(-exposure if option_type == 'call' else exposure)
+    
+    def _exposure_debug(self, gamma: float, open_interest: int, spot: float,
+                        option_type: str, strike: float = None) -> float:
+        """calculate_exposure with every intermediate value printed"""
+        exposure = self._exposure_fast(gamma, open_interest, spot, option_type)
+        if strike is None:
+            return exposure
+        
+        print(f"\n  DEBUG: calculate_exposure() for {option_type.upper()} at strike {strike}")
+        print(f"    gamma                = {gamma:>20.10f}")
+        print(f"    open_interest        = {open_interest:>20,}")
+        print(f"    contract_multiplier  = {self.contract_multiplier:>20,}")
+        print(f"    spot                 = {spot:>20.2f}")
+        print(f"    raw_exposure         = {gamma * open_interest * self.contract_multiplier * spot:>20,.2f}")
         if option_type == 'call':
-            exposure = -exposure  # Negative for calls (resistance)
-            if self.debug and strike is not None:
-                print(f"    sign_convention      = -1 (call = negative)")
-        else:  # put
-            exposure = exposure   # Positive for puts (support)
-            if self.debug and strike is not None:
-                print(f"    sign_convention      = +1 (put = positive)")
-        
-        if self.debug and strike is not None:
-            print(f"    final_exposure       = {exposure:>20,.2f}")
-        
-        return float(exposure)
+            print(f"    sign_convention      = -1 (call = negative)")
+        else:
+            print(f"    sign_convention      = +1 (put = positive)")
+        print(f"    final_exposure       = {exposure:>20,.2f}")
+        
+        return exposure
     
     def calculate_contract_gamma_exposure(self, 
                                         contract: OptionsContract, 
@@ -244,26 +453,95 @@ class GammaCalculator:
             
             return exposure
             
-        except Exception as e:
+        except (GammaCalculationError, TypeError) as e:
+            # TypeError comes from an expiry_date that is not a datetime
             raise GammaCalculationError(f"Error calculating exposure for contract {contract.symbol} {contract.strike} {contract.option_type}: {str(e)}")
     
     def aggregate_by_strike(self, 
                            contracts: List[OptionsContract], 
                            spot: float,
-                           current_date: Optional[datetime] = None) -> List[GammaExposure]:
+                           current_date: Optional[datetime] = None,
+                           return_arrays: bool = False):
         """
         Calculate and aggregate gamma exposure by strike price
         
         Args:
-            contracts: List of OptionsContract objects
+            contracts: List of OptionsContract objects, or an OptionsChainSoA
+                (its columns feed the kernel without building contracts)
             spot: Current underlying price
             current_date: Current date (defaults to now)
+            return_arrays: Also return the per-strike arrays (see GammaExposure.to_arrays)
+                so downstream analyzers can skip rebuilding them
             
         Returns:
-            List of GammaExposure objects aggregated by strike
+            List of GammaExposure objects aggregated by strike, or a
+            (list, arrays) tuple when return_arrays is True
         """
         if not contracts:
-            return []
+            return self._result([], return_arrays)
+        
+        # Debug mode keeps the per-contract path so every intermediate value is printed
+        if self.debug:
+            return self._result(self._aggregate_by_strike_loop(contracts, spot, current_date), return_arrays)
+        
+        if spot <= 0:
+            raise GammaCalculationError(f"Spot price must be positive: {spot}")
+        current_date = self._valuation_time(current_date)
+        
+        soa = self._to_soa(contracts, current_date)
+        return self._result(self._aggregate_arrays(
+            soa['strike'], soa['time_to_expiry'], soa['volatility'],
+            soa['open_interest'], soa['is_call'], spot
+        ), return_arrays)
+    
+    @staticmethod
+    def _result(gamma_exposures: List[GammaExposure], return_arrays: bool):
+        """Shape an aggregation result for the return_arrays option"""
+        if return_arrays:
+            return gamma_exposures, GammaExposure.to_arrays(gamma_exposures)
+        return gamma_exposures
+    
+    def _valuation_time(self, current_date: Optional[datetime]) -> datetime:
+        """Resolve the valuation time, truncated to the minute when memoizing so repeat runs share results"""
+        if current_date is not None:
+            return current_date
+        now = datetime.now()
+        return now.replace(second=0, microsecond=0) if self._memo is not None else now
+    
+    def _to_soa(self, contracts: List[OptionsContract], current_date: datetime) -> Dict[str, np.ndarray]:
+        """
+        Convert contracts to parallel NumPy arrays (struct of arrays) for the vectorized kernels
+        
+        Args:
+            contracts: List of OptionsContract objects
+            current_date: Valuation datetime
+            
+        Returns:
+            Dict of 'strike', 'time_to_expiry', 'volatility' (fallback and bounds
+            applied), 'open_interest' and 'is_call' arrays
+        """
+        arrays = OptionsContract.to_arrays(contracts)
+        
+        # Time to expiry for every contract in one vectorized step, clamped like calculate_time_to_expiry
+        time_to_expiry = _years_to_expiry(arrays['expiry'], current_date)
+        
+        raw_vol = arrays['iv']
+        return {
+            'strike': arrays['strike'],
+            'time_to_expiry': time_to_expiry,
+            # Same volatility fallback and bounds as calculate_contract_gamma_exposure
+            'volatility': np.clip(np.where(raw_vol > 0, raw_vol, DEFAULT_VOLATILITY), MIN_VOLATILITY, MAX_VOLATILITY),
+            'open_interest': arrays['oi'],
+            'is_call': arrays['is_call']
+        }
+    
+    def _aggregate_by_strike_loop(self, 
+                                  contracts: List[OptionsContract], 
+                                  spot: float,
+                                  current_date: Optional[datetime] = None) -> List[GammaExposure]:
+        """Per-contract version of aggregate_by_strike, used in debug mode"""
+        # Resolve "now" once so every contract is priced at the same instant
+        current_date = self._valuation_time(current_date)
         
         # Group contracts by strike
         strike_groups = {}
@@ -277,10 +555,13 @@ class GammaCalculator:
             else:
                 strike_groups[strike]['puts'].append(contract)
         
-        # Calculate exposure for each strike
+        # Calculate exposure for each strike; failures are collected and reported once at the end
         gamma_exposures = []
+        errors = []
         
-        for strike, groups in strike_groups.items():
+        # Walk strikes in ascending order so the result needs no final sort
+        for strike in sorted(strike_groups):
+            groups = strike_groups[strike]
             call_exposure = 0.0
             put_exposure = 0.0
             total_oi = 0
@@ -292,8 +573,7 @@ class GammaCalculator:
                     call_exposure += exposure
                     total_oi += call_contract.open_interest
                 except GammaCalculationError as e:
-                    print(f"Warning: {e}")
-                    continue
+                    errors.append(e)
             
             # Calculate put exposure  
             for put_contract in groups['puts']:
@@ -302,8 +582,7 @@ class GammaCalculator:
                     put_exposure += exposure
                     total_oi += put_contract.open_interest
                 except GammaCalculationError as e:
-                    print(f"Warning: {e}")
-                    continue
+                    errors.append(e)
             
             # Create GammaExposure object
             net_exposure = call_exposure + put_exposure
@@ -318,9 +597,167 @@ class GammaCalculator:
             
             gamma_exposures.append(gamma_exposure)
         
-        # Sort by strike price
-        gamma_exposures.sort(key=lambda x: x.strike)
+        if errors:
+            print(f"Warning: Skipped {len(errors)} contracts during gamma aggregation (first: {errors[0]})")
+        
+        return gamma_exposures
+    
+    def aggregate_by_strike_df(self, 
+                              options_df: pd.DataFrame, 
+                              spot: float,
+                              current_date: Optional[datetime] = None,
+                              return_arrays: bool = False):
+        """
+        Calculate and aggregate gamma exposure by strike directly from an options DataFrame
+        
+        Column-wise equivalent of aggregate_by_strike: works on the strike,
+        expiry_date, option_type, open_interest and implied_volatility columns
+        without building an OptionsContract per row. Rows that would fail
+        contract validation are skipped.
+        
+        Args:
+            options_df: Options data DataFrame
+            spot: Current underlying price
+            current_date: Current date (defaults to now)
+            return_arrays: Also return the per-strike arrays, as in aggregate_by_strike
+            
+        Returns:
+            List of GammaExposure objects aggregated by strike, or a
+            (list, arrays) tuple when return_arrays is True
+        """
+        if options_df is None or options_df.empty:
+            return self._result([], return_arrays)
+        if spot <= 0:
+            raise GammaCalculationError(f"Spot price must be positive: {spot}")
+        current_date = self._valuation_time(current_date)
+        
+        strikes = pd.to_numeric(options_df['strike'], errors='coerce').to_numpy(dtype=float)
+        open_interest = pd.to_numeric(options_df['open_interest'], errors='coerce').to_numpy(dtype=float)
+        option_types = options_df['option_type']
+        if isinstance(option_types.dtype, pd.CategoricalDtype):
+            # Lower-case the few categories only and look rows up by code (-1 marks NaN)
+            labels = np.append(option_types.cat.categories.astype(str).str.lower().to_numpy(), '')
+            option_types = labels[option_types.cat.codes.to_numpy()]
+        else:
+            option_types = option_types.astype(str).str.lower().to_numpy()
+        expiries = pd.to_datetime(options_df['expiry_date'], errors='coerce')
+        if 'implied_volatility' in options_df.columns:
+            raw_vol = pd.to_numeric(options_df['implied_volatility'], errors='coerce').to_numpy(dtype=float)
+        else:
+            raw_vol = np.full(len(options_df), DEFAULT_VOLATILITY)
+        
+        is_call = option_types == 'call'
+        valid = (
+            (is_call | (option_types == 'put')) &
+            (strikes > 0) &
+            (open_interest >= 0) &
+            ~(raw_vol < 0) &
+            expiries.notna().to_numpy()
+        )
+        skipped_rows = int((~valid).sum())
+        if skipped_rows > 0:
+            print(f"Warning: Skipped {skipped_rows} invalid rows during gamma aggregation")
+        if not valid.any():
+            return self._result([], return_arrays)
+        
+        strikes = strikes[valid]
+        open_interest = np.floor(open_interest[valid])
+        is_call = is_call[valid]
+        raw_vol = raw_vol[valid]
+        
+        # Time to expiry in years, clamped like calculate_time_to_expiry
+        time_to_expiry = _years_to_expiry(expiries[valid].to_numpy(dtype='datetime64[ns]'), current_date)
+        
+        # Same volatility fallback and bounds as calculate_contract_gamma_exposure
+        volatility = np.where(raw_vol > 0, raw_vol, DEFAULT_VOLATILITY)
+        volatility = np.clip(volatility, MIN_VOLATILITY, MAX_VOLATILITY)
+        
+        return self._result(
+            self._aggregate_arrays(strikes, time_to_expiry, volatility, open_interest, is_call, spot),
+            return_arrays
+        )
+    
+    def _aggregate_arrays(self, 
+                          strikes: np.ndarray, 
+                          time_to_expiry: np.ndarray, 
+                          volatility: np.ndarray, 
+                          open_interest: np.ndarray, 
+                          is_call: np.ndarray, 
+                          spot: float) -> List[GammaExposure]:
+        """
+        Compute gamma exposure per contract and sum it into sorted strike buckets
+        
+        Args:
+            strikes: Strike prices
+            time_to_expiry: Times to expiry in years (already clamped)
+            volatility: Implied volatilities (already bounded)
+            open_interest: Open interest per contract
+            is_call: True for calls, False for puts
+            spot: Current underlying price
+            
+        Returns:
+            List of GammaExposure objects sorted by strike
+        """
+        # Validate the whole chain once so the kernels can run without per-contract checks;
+        # invalid contracts are dropped, as the per-contract loop skips them
+        valid = (
+            (strikes > 0) & (time_to_expiry > 0) &
+            (volatility >= MIN_VOLATILITY) & (volatility <= MAX_VOLATILITY) &
+            (open_interest >= 0)
+        )
+        if not valid.all():
+            print(f"Warning: Skipped {int((~valid).sum())} invalid contracts during gamma aggregation")
+            strikes, time_to_expiry, volatility = strikes[valid], time_to_expiry[valid], volatility[valid]
+            open_interest, is_call = open_interest[valid], is_call[valid]
+        
+        if self._memo is not None:
+            digest = hashlib.blake2b(repr((float(spot), self.risk_free_rate, self.contract_multiplier)).encode())
+            for arr in (strikes, time_to_expiry, volatility, open_interest, is_call):
+                digest.update(np.ascontiguousarray(arr).tobytes())
+            key = digest.hexdigest()
+            with self._memo_lock:
+                if key in self._memo:
+                    self._memo.move_to_end(key)
+                    return list(self._memo[key])
+        
+        unique_strikes, bucket_idx = np.unique(strikes, return_inverse=True)
+        
+        # Zero open interest contributes zero exposure, so those rows skip the kernel
+        # (often a large share of a chain); their strikes still get a bucket above
+        live = open_interest > 0
+        fdt = self.dtype
+        call_exposure, put_exposure, total_oi, non_finite = _strike_bucket_exposure(
+            bucket_idx[live].astype(np.int64),
+            len(unique_strikes),
+            np.ascontiguousarray(strikes[live], dtype=fdt),
+            np.ascontiguousarray(time_to_expiry[live], dtype=fdt),
+            np.ascontiguousarray(volatility[live], dtype=fdt),
+            np.ascontiguousarray(open_interest[live], dtype=fdt),
+            np.ascontiguousarray(is_call[live], dtype=np.bool_),
+            fdt.type(spot),
+            fdt.type(self.risk_free_rate),
+            fdt.type(self.contract_multiplier)
+        )
+        if non_finite > 0:
+            print(f"Warning: Gamma calculation resulted in NaN or infinity for {non_finite} contracts")
+        
+        gamma_exposures = [
+            GammaExposure(
+                strike=float(strike),
+                call_gamma_exposure=float(call_exp),
+                put_gamma_exposure=float(put_exp),
+                net_gamma_exposure=float(call_exp) + float(put_exp),
+                total_open_interest=int(oi)
+            )
+            for strike, call_exp, put_exp, oi in zip(unique_strikes, call_exposure, put_exposure, total_oi)
+        ]
         
+        if self._memo is not None:
+            with self._memo_lock:
+                self._memo[key] = gamma_exposures
+                if len(self._memo) > MEMO_MAX_ENTRIES:
+                    self._memo.popitem(last=False)
+            return list(gamma_exposures)
         return gamma_exposures
     
     def calculate_portfolio_metrics(self, gamma_exposures: List[GammaExposure]) -> Dict[str, float]:
@@ -342,16 +779,18 @@ class GammaCalculator:
                 'total_open_interest': 0
             }
         
-        total_net_gamma = sum(ge.net_gamma_exposure for ge in gamma_exposures)
-        total_call_gamma = sum(ge.call_gamma_exposure for ge in gamma_exposures)
-        total_put_gamma = sum(ge.put_gamma_exposure for ge in gamma_exposures)
-        total_open_interest = sum(ge.total_open_interest for ge in gamma_exposures)
+        # One pass over the objects into arrays, then column sums
+        arr = GammaExposure.to_arrays(gamma_exposures)
+        total_net_gamma = float(arr['net'].sum())
+        total_call_gamma = float(arr['call'].sum())
+        total_put_gamma = float(arr['put'].sum())
+        total_open_interest = int(arr['oi'].sum())
         
         # Calculate gamma-weighted average strike
         if total_net_gamma != 0:
-            weighted_sum = sum(ge.strike * abs(ge.net_gamma_exposure) for ge in gamma_exposures)
-            total_abs_gamma = sum(abs(ge.net_gamma_exposure) for ge in gamma_exposures)
-            gamma_weighted_avg_strike = weighted_sum / total_abs_gamma if total_abs_gamma > 0 else 0.0
+            abs_net = np.abs(arr['net'])
+            total_abs_gamma = float(abs_net.sum())
+            gamma_weighted_avg_strike = float((arr['strike'] * abs_net).sum()) / total_abs_gamma if total_abs_gamma > 0 else 0.0
         else:
             gamma_weighted_avg_strike = 0.0
         
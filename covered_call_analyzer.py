@@ -6,14 +6,37 @@ Usage: python covered_call_analyzer.py [symbol] [expiration]
 
 import sys
 from datetime import datetime
+import numpy as np
 from data.yfinance_fetcher import YFinanceOptionsFetcher
 from calculations.gamma import GammaCalculator
 from analysis.walls import WallAnalyzer
 from analysis.metrics import MetricsCalculator
 
 
+# Calculators are stateless across symbols, so one set is reused for every analysis
+_ENGINES = None
+
+
+# Strike-selection hint printed under each call wall, keyed by its recommendation
+_WALL_HINTS = {
+    "🎯 OPTIMAL": "Strong resistance, good risk/reward",
+    "⚠️ TOO CLOSE": "High assignment risk, low premium",
+    "📊 CONSERVATIVE": "Lower assignment risk, lower premium",
+}
+
+
+def _get_engines():
+    """Return the shared (GammaCalculator, WallAnalyzer, MetricsCalculator), creating them on first use"""
+    global _ENGINES
+    if _ENGINES is None:
+        _ENGINES = (GammaCalculator(), WallAnalyzer(), MetricsCalculator())
+    return _ENGINES
+
+
 def analyze_covered_call_environment(symbol='SPY', expiration=None):
     """Analyze gamma environment for covered call strategy"""
+    # Report lines, written to stdout in one go rather than one print per line
+    out = []
     try:
         print(f"📊 Covered Call Strategy Analysis: {symbol}")
         if expiration:
@@ -43,23 +66,21 @@ def analyze_covered_call_environment(symbol='SPY', expiration=None):
         contracts = fetcher.convert_to_contracts(options_df)
         
         # Calculate gamma metrics
-        calculator = GammaCalculator()
-        gamma_exposures = calculator.aggregate_by_strike(contracts, current_price)
-        
-        wall_analyzer = WallAnalyzer()
+        calculator, wall_analyzer, metrics_calc = _get_engines()
+        gamma_exposures, exposure_arrays = calculator.aggregate_by_strike(contracts, current_price, return_arrays=True)
         walls = wall_analyzer.find_all_walls(gamma_exposures, current_price)
         
-        metrics_calc = MetricsCalculator()
-        market_metrics = metrics_calc.calculate_all_metrics(gamma_exposures)
-        gamma_env = metrics_calc.calculate_gamma_environment(gamma_exposures, current_price)
+        # Both metric passes reduce over the same per-strike arrays
+        market_metrics = metrics_calc.calculate_all_metrics(gamma_exposures, arrays=exposure_arrays)
+        gamma_env = metrics_calc.calculate_gamma_environment(gamma_exposures, current_price, arrays=exposure_arrays)
         
         # Display current market state
-        print(f"💰 Current {symbol} Price: ${current_price:.2f}")
-        print(f"📊 Options Contracts Analyzed: {len(contracts)}")
+        out.append(f"💰 Current {symbol} Price: ${current_price:.2f}")
+        out.append(f"📊 Options Contracts Analyzed: {len(contracts)}")
         
         # Gamma environment analysis
-        print(f"\n🌊 GAMMA ENVIRONMENT ANALYSIS")
-        print("-" * 50)
+        out.append(f"\n🌊 GAMMA ENVIRONMENT ANALYSIS")
+        out.append("-" * 50)
         
         env_type = gamma_env['environment'].upper()
         strength_info = gamma_env['strength_interpretation']
@@ -77,75 +98,70 @@ def analyze_covered_call_environment(symbol='SPY', expiration=None):
             cc_rating = "MODERATE"
             cc_color = "🟡"
         
-        print(f"{env_icon} Environment: {env_type}")
-        print(f"💪 Strength: {strength_info['level']} ({gamma_env['environment_strength']:.4f})")
-        print(f"{cc_color} Covered Call Rating: {cc_rating}")
+        out.append(f"{env_icon} Environment: {env_type}")
+        out.append(f"💪 Strength: {strength_info['level']} ({gamma_env['environment_strength']:.4f})")
+        out.append(f"{cc_color} Covered Call Rating: {cc_rating}")
         
         # Covered call specific analysis
-        print(f"\n📋 COVERED CALL STRATEGY ANALYSIS")
-        print("-" * 50)
+        out.append(f"\n📋 COVERED CALL STRATEGY ANALYSIS")
+        out.append("-" * 50)
         
         if gamma_env['environment'] == 'positive':
-            print("✅ POSITIVE GAMMA - EXCELLENT for Covered Calls:")
-            print("   🛡️ Market makers provide price stability")
-            print("   📉 Mean-reverting price action expected")
-            print("   🔄 Lower volatility environment")
-            print("   🎯 Higher probability of calls expiring worthless")
-            print("   💰 Better premium retention")
+            out.append("✅ POSITIVE GAMMA - EXCELLENT for Covered Calls:")
+            out.append("   🛡️ Market makers provide price stability")
+            out.append("   📉 Mean-reverting price action expected")
+            out.append("   🔄 Lower volatility environment")
+            out.append("   🎯 Higher probability of calls expiring worthless")
+            out.append("   💰 Better premium retention")
             
             if strength_info['level'] in ['Very Strong', 'Strong']:
-                print("   🚀 HIGH CONFIDENCE: Strong gamma forces support strategy")
+                out.append("   🚀 HIGH CONFIDENCE: Strong gamma forces support strategy")
             else:
-                print("   ⚠️ MODERATE CONFIDENCE: Weaker gamma forces")
+                out.append("   ⚠️ MODERATE CONFIDENCE: Weaker gamma forces")
         
         elif gamma_env['environment'] == 'negative':
-            print("❌ NEGATIVE GAMMA - RISKY for Covered Calls:")
-            print("   ⚡ Market makers amplify price moves")
-            print("   📈 Momentum/trending price action expected")
-            print("   🌪️ Higher volatility environment")
-            print("   💥 Higher risk of calls being exercised")
-            print("   📊 Consider defensive adjustments")
+            out.append("❌ NEGATIVE GAMMA - RISKY for Covered Calls:")
+            out.append("   ⚡ Market makers amplify price moves")
+            out.append("   📈 Momentum/trending price action expected")
+            out.append("   🌪️ Higher volatility environment")
+            out.append("   💥 Higher risk of calls being exercised")
+            out.append("   📊 Consider defensive adjustments")
             
             if strength_info['level'] in ['Very Strong', 'Strong']:
-                print("   🚨 HIGH RISK: Strong negative gamma forces")
+                out.append("   🚨 HIGH RISK: Strong negative gamma forces")
             else:
-                print("   ⚠️ MODERATE RISK: Weaker negative gamma forces")
+                out.append("   ⚠️ MODERATE RISK: Weaker negative gamma forces")
         
         else:
-            print("⚖️ NEUTRAL GAMMA - MODERATE for Covered Calls:")
-            print("   🎯 Mixed gamma forces")
-            print("   📊 Moderate volatility expected")
-            print("   🔄 Standard covered call management applies")
+            out.append("⚖️ NEUTRAL GAMMA - MODERATE for Covered Calls:")
+            out.append("   🎯 Mixed gamma forces")
+            out.append("   📊 Moderate volatility expected")
+            out.append("   🔄 Standard covered call management applies")
         
         # Call wall analysis for strike selection
         call_walls = walls.get('call_walls', [])
         if call_walls:
-            print(f"\n🔴 CALL WALL ANALYSIS (Resistance Levels)")
-            print("-" * 50)
-            print("Optimal strike selection based on gamma walls:")
+            out.append(f"\n🔴 CALL WALL ANALYSIS (Resistance Levels)")
+            out.append("-" * 50)
+            out.append("Optimal strike selection based on gamma walls:")
             
-            for i, wall in enumerate(call_walls[:3], 1):
-                distance_pct = ((wall.strike - current_price) / current_price) * 100
-                
-                if distance_pct > 0:  # Above current price
-                    if 1 <= distance_pct <= 5:
-                        recommendation = "🎯 OPTIMAL"
-                    elif distance_pct <= 1:
-                        recommendation = "⚠️ TOO CLOSE"
-                    else:
-                        recommendation = "📊 CONSERVATIVE"
-                else:
-                    recommendation = "❌ AVOID (ITM)"
-                
-                print(f"   #{i}: {wall.strike:.0f} ({distance_pct:+.1f}%) - {recommendation}")
-                print(f"       Gamma Exposure: {wall.exposure_value:,.0f}")
+            # Classify every wall at once: distance from spot picks the recommendation
+            top_walls = call_walls[:3]
+            wall_strikes = np.fromiter((wall.strike for wall in top_walls), dtype=float, count=len(top_walls))
+            distance_pcts = (wall_strikes - current_price) / current_price * 100
+            recommendations = np.select(
+                [distance_pcts <= 0, distance_pcts < 1, distance_pcts <= 5],
+                ["❌ AVOID (ITM)", "⚠️ TOO CLOSE", "🎯 OPTIMAL"],
+                default="📊 CONSERVATIVE"
+            )
+            
+            for i, (wall, distance_pct, recommendation) in enumerate(zip(top_walls, distance_pcts, recommendations), 1):
+                out.append(f"   #{i}: {wall.strike:.0f} ({distance_pct:+.1f}%) - {recommendation}")
+                out.append(f"       Gamma Exposure: {wall.exposure_value:,.0f}")
                 
-                if recommendation == "🎯 OPTIMAL":
-                    print(f"       💡 Strong resistance, good risk/reward")
-                elif recommendation == "⚠️ TOO CLOSE":
-                    print(f"       💡 High assignment risk, low premium")
-                elif recommendation == "📊 CONSERVATIVE":
-                    print(f"       💡 Lower assignment risk, lower premium")
+                hint = _WALL_HINTS.get(str(recommendation))
+                if hint:
+                    out.append(f"       💡 {hint}")
         
         # Flip level implications for covered calls
         if gamma_env['gamma_flip_level']:
@@ -153,75 +169,77 @@ def analyze_covered_call_environment(symbol='SPY', expiration=None):
             flip_distance = flip_level - current_price
             flip_distance_pct = (flip_distance / current_price) * 100
             
-            print(f"\n🔄 GAMMA FLIP LEVEL IMPLICATIONS")
-            print("-" * 50)
-            print(f"Flip Level: {flip_level:.0f} ({flip_distance:+.0f}, {flip_distance_pct:+.1f}%)")
+            out.append(f"\n🔄 GAMMA FLIP LEVEL IMPLICATIONS")
+            out.append("-" * 50)
+            out.append(f"Flip Level: {flip_level:.0f} ({flip_distance:+.0f}, {flip_distance_pct:+.1f}%)")
             
             if gamma_env['environment'] == 'positive' and flip_distance > 0:
-                print("🎯 COVERED CALL SWEET SPOT:")
-                print(f"   • Current price protected by positive gamma")
-                print(f"   • Strong resistance expected below {flip_level:.0f}")
-                print(f"   • Consider strikes between current price and flip level")
-                print(f"   • If breached above {flip_level:.0f}, expect acceleration")
+                out.append("🎯 COVERED CALL SWEET SPOT:")
+                out.append(f"   • Current price protected by positive gamma")
+                out.append(f"   • Strong resistance expected below {flip_level:.0f}")
+                out.append(f"   • Consider strikes between current price and flip level")
+                out.append(f"   • If breached above {flip_level:.0f}, expect acceleration")
             
             elif gamma_env['environment'] == 'negative' and flip_distance > 0:
-                print("⚠️ COVERED CALL CAUTION:")
-                print(f"   • Currently in momentum environment")
-                print(f"   • Stabilization only above {flip_level:.0f}")
-                print(f"   • High risk of upward acceleration")
-                print(f"   • Consider wider strikes or defensive management")
+                out.append("⚠️ COVERED CALL CAUTION:")
+                out.append(f"   • Currently in momentum environment")
+                out.append(f"   • Stabilization only above {flip_level:.0f}")
+                out.append(f"   • High risk of upward acceleration")
+                out.append(f"   • Consider wider strikes or defensive management")
         
         # Strategy recommendations
-        print(f"\n💡 COVERED CALL STRATEGY RECOMMENDATIONS")
-        print("-" * 50)
+        out.append(f"\n💡 COVERED CALL STRATEGY RECOMMENDATIONS")
+        out.append("-" * 50)
         
         if gamma_env['environment'] == 'positive':
             if strength_info['level'] in ['Very Strong', 'Strong']:
-                print("🚀 AGGRESSIVE STRATEGY (High Confidence):")
-                print("   • Sell calls closer to current price (1-3% OTM)")
-                print("   • Higher premium collection")
-                print("   • Strong gamma support reduces assignment risk")
+                out.append("🚀 AGGRESSIVE STRATEGY (High Confidence):")
+                out.append("   • Sell calls closer to current price (1-3% OTM)")
+                out.append("   • Higher premium collection")
+                out.append("   • Strong gamma support reduces assignment risk")
             else:
-                print("📊 STANDARD STRATEGY (Moderate Confidence):")
-                print("   • Sell calls at moderate distance (2-5% OTM)")
-                print("   • Balance premium vs assignment risk")
+                out.append("📊 STANDARD STRATEGY (Moderate Confidence):")
+                out.append("   • Sell calls at moderate distance (2-5% OTM)")
+                out.append("   • Balance premium vs assignment risk")
         
         elif gamma_env['environment'] == 'negative':
             if strength_info['level'] in ['Very Strong', 'Strong']:
-                print("🛡️ DEFENSIVE STRATEGY (High Risk):")
-                print("   • Sell calls further OTM (5-10% OTM)")
-                print("   • Consider shorter expirations")
-                print("   • Prepare for early assignment")
-                print("   • Consider avoiding covered calls entirely")
+                out.append("🛡️ DEFENSIVE STRATEGY (High Risk):")
+                out.append("   • Sell calls further OTM (5-10% OTM)")
+                out.append("   • Consider shorter expirations")
+                out.append("   • Prepare for early assignment")
+                out.append("   • Consider avoiding covered calls entirely")
             else:
-                print("⚠️ CAUTIOUS STRATEGY (Moderate Risk):")
-                print("   • Sell calls at wider strikes (3-7% OTM)")
-                print("   • Monitor closely for momentum breaks")
+                out.append("⚠️ CAUTIOUS STRATEGY (Moderate Risk):")
+                out.append("   • Sell calls at wider strikes (3-7% OTM)")
+                out.append("   • Monitor closely for momentum breaks")
         
         else:
-            print("📊 BALANCED STRATEGY:")
-            print("   • Standard covered call approach (2-5% OTM)")
-            print("   • Normal risk management")
+            out.append("📊 BALANCED STRATEGY:")
+            out.append("   • Standard covered call approach (2-5% OTM)")
+            out.append("   • Normal risk management")
         
         # Risk assessment
-        print(f"\n⚠️ RISK ASSESSMENT")
-        print("-" * 50)
+        out.append(f"\n⚠️ RISK ASSESSMENT")
+        out.append("-" * 50)
         
         if gamma_env['environment'] == 'positive':
             risk_level = "LOW" if strength_info['level'] in ['Very Strong', 'Strong'] else "MODERATE"
-            print(f"🟢 Assignment Risk: {risk_level}")
-            print("   • Mean-reverting environment favors covered calls")
-            print("   • Strong support levels limit upside")
+            out.append(f"🟢 Assignment Risk: {risk_level}")
+            out.append("   • Mean-reverting environment favors covered calls")
+            out.append("   • Strong support levels limit upside")
         else:
             risk_level = "HIGH" if strength_info['level'] in ['Very Strong', 'Strong'] else "MODERATE"
-            print(f"🔴 Assignment Risk: {risk_level}")
-            print("   • Momentum environment increases assignment risk")
-            print("   • Consider defensive position sizing")
+            out.append(f"🔴 Assignment Risk: {risk_level}")
+            out.append("   • Momentum environment increases assignment risk")
+            out.append("   • Consider defensive position sizing")
         
-        print(f"\n✅ Analysis complete for {symbol} covered call strategy")
+        out.append(f"\n✅ Analysis complete for {symbol} covered call strategy")
+        sys.stdout.write("\n".join(out) + "\n")
         return True
         
     except Exception as e:
+        sys.stdout.write("".join(line + "\n" for line in out))
         print(f"❌ Error: {str(e)}")
         return False
 
@@ -0,0 +1,172 @@
+"""
+Simple on-disk TTL cache for slow Yahoo Finance lookups
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Iterable, Optional
+
+
+DEFAULT_CACHE_DIR = '.cache'
+
+
+class FileCache:
+    """Pickle-backed cache where each entry is a file and its mtime is the write time"""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR):
+        """
+        Initialize the cache
+
+        Args:
+            directory: Directory holding the cache files (created on first write)
+        """
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """
+        Get a cached value if it is younger than ``ttl`` seconds
+
+        Args:
+            key: Cache key
+            ttl: Maximum age in seconds
+
+        Returns:
+            The cached value, or None if missing, expired or unreadable
+        """
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > ttl:
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value under ``key``
+
+        The file is written to a temporary name and renamed into place so
+        concurrent readers never see a partial entry.
+
+        Args:
+            key: Cache key
+            value: Picklable value to store
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"Warning: Could not write cache entry {key}: {e}")
+
+
+class MemoryCache:
+    """In-process cache for values that go stale within minutes, such as quotes"""
+
+    def __init__(self):
+        """Initialize an empty cache"""
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, ttl: float) -> Optional[Any]:
+        """
+        Get a cached value if it is younger than ``ttl`` seconds
+
+        Args:
+            key: Cache key (any hashable)
+            ttl: Maximum age in seconds
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > ttl:
+            return None
+        return entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        """
+        Store a value under ``key``
+
+        Args:
+            key: Cache key (any hashable)
+            value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+
+    def delete(self, *keys: Any) -> None:
+        """Remove ``keys`` from the cache, ignoring keys that are not present"""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+def make_key(*parts: Any) -> str:
+    """Build a cache key from ``parts`` and today's date, so entries roll over daily"""
+    raw = '|'.join(str(part) for part in (*parts, date.today().isoformat()))
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def cached(ttl: float, cache: Optional[FileCache] = None,
+           ignore: Iterable[str] = ('self', 'fetcher')) -> Callable:
+    """
+    Decorator caching a function's return value on disk for ``ttl`` seconds
+
+    The key is built from the function name and its bound arguments, except
+    those named in ``ignore`` (objects such as the fetcher itself). The wrapper
+    also gets ``peek(*args, **kwargs)``, returning the cached value or None
+    without calling the function, and ``seed(value, *args, **kwargs)``, storing
+    a value computed elsewhere (e.g. by a batched request).
+
+    Args:
+        ttl: Maximum age of a cached value in seconds
+        cache: Cache to use (defaults to a FileCache in DEFAULT_CACHE_DIR)
+        ignore: Argument names left out of the key
+    """
+    store = cache or FileCache()
+    ignored = set(ignore)
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        def key_for(*args, **kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            parts = [f"{name}={value!r}" for name, value in bound.arguments.items()
+                     if name not in ignored]
+            return make_key(func.__qualname__, *parts)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = key_for(*args, **kwargs)
+            value = store.get(key, ttl)
+            if value is None:
+                value = func(*args, **kwargs)
+                store.set(key, value)
+            return value
+
+        def peek(*args, **kwargs) -> Optional[Any]:
+            return store.get(key_for(*args, **kwargs), ttl)
+
+        def seed(value: Any, *args, **kwargs) -> None:
+            store.set(key_for(*args, **kwargs), value)
+
+        wrapper.peek = peek
+        wrapper.seed = seed
+        return wrapper
+
+    return decorator
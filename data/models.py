@@ -4,10 +4,15 @@ Data models for SPX Gamma Exposure Calculator
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+import numpy as np
 import pandas as pd
 
 
+# Valid OptionsContract.option_type values
+OPTION_TYPES = frozenset({'call', 'put'})
+
+
 @dataclass
 class OptionsContract:
     """Represents a single options contract"""
@@ -24,7 +29,7 @@ class OptionsContract:
     
     def __post_init__(self):
         """Validate data after initialization"""
-        if self.option_type not in ['call', 'put']:
+        if self.option_type not in OPTION_TYPES:
             raise ValueError(f"Invalid option_type: {self.option_type}. Must be 'call' or 'put'")
         if self.strike <= 0:
             raise ValueError(f"Strike price must be positive: {self.strike}")
@@ -33,6 +38,18 @@ class OptionsContract:
         if self.implied_volatility < 0:
             raise ValueError(f"Implied volatility cannot be negative: {self.implied_volatility}")
     
+    @classmethod
+    def _from_validated(cls, symbol, strike, expiry_date, option_type, open_interest,
+                        volume, bid, ask, last_price, implied_volatility) -> 'OptionsContract':
+        """Build a contract from values already validated in bulk, skipping __post_init__"""
+        contract = object.__new__(cls)
+        contract.__dict__.update(
+            symbol=symbol, strike=strike, expiry_date=expiry_date, option_type=option_type,
+            open_interest=open_interest, volume=volume, bid=bid, ask=ask,
+            last_price=last_price, implied_volatility=implied_volatility
+        )
+        return contract
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
@@ -55,6 +72,32 @@ class OptionsContract:
         if isinstance(data['expiry_date'], str):
             data['expiry_date'] = datetime.fromisoformat(data['expiry_date'])
         return cls(**data)
+    
+    @staticmethod
+    def to_arrays(contracts: List['OptionsContract'], dtype=np.float64) -> Dict[str, np.ndarray]:
+        """
+        Convert contracts to parallel NumPy arrays (struct of arrays)
+        
+        Args:
+            contracts: List of OptionsContract objects (an OptionsChainSoA is
+                returned column-wise without iterating)
+            dtype: Float dtype for the strike and iv arrays
+            
+        Returns:
+            Dict of 'strike', 'iv' (dtype), 'oi' (int64), 'expiry' (datetime64[ns])
+            and 'is_call' (bool) arrays, one element per contract
+        """
+        if isinstance(contracts, OptionsChainSoA):
+            return contracts.to_arrays(dtype)
+        
+        n = len(contracts)
+        return {
+            'strike': np.fromiter((c.strike for c in contracts), dtype=dtype, count=n),
+            'iv': np.fromiter((c.implied_volatility for c in contracts), dtype=dtype, count=n),
+            'oi': np.fromiter((c.open_interest for c in contracts), dtype=np.int64, count=n),
+            'expiry': np.array([c.expiry_date for c in contracts], dtype='datetime64[ns]'),
+            'is_call': np.fromiter((c.option_type == 'call' for c in contracts), dtype=np.bool_, count=n)
+        }
 
 
 @dataclass
@@ -92,6 +135,26 @@ class GammaExposure:
     def from_dict(cls, data: Dict[str, Any]) -> 'GammaExposure':
         """Create instance from dictionary"""
         return cls(**data)
+    
+    @staticmethod
+    def to_arrays(gamma_exposures: List['GammaExposure']) -> Dict[str, np.ndarray]:
+        """
+        Convert strike exposures to parallel NumPy arrays (struct of arrays)
+        
+        Args:
+            gamma_exposures: List of GammaExposure objects
+            
+        Returns:
+            Dict of 'strike', 'call', 'put', 'net' (float64) and 'oi' (int64) arrays
+        """
+        n = len(gamma_exposures)
+        arr = np.fromiter(
+            ((ge.strike, ge.call_gamma_exposure, ge.put_gamma_exposure, ge.net_gamma_exposure, ge.total_open_interest)
+             for ge in gamma_exposures),
+            dtype=[('strike', 'f8'), ('call', 'f8'), ('put', 'f8'), ('net', 'f8'), ('oi', 'i8')],
+            count=n
+        )
+        return {name: np.ascontiguousarray(arr[name]) for name in arr.dtype.names}
 
 
 @dataclass
@@ -167,34 +230,236 @@ class MarketMetrics:
         return cls(**data)
 
 
-def dataframe_to_options_contracts(df: pd.DataFrame) -> list[OptionsContract]:
-    """Convert DataFrame to list of OptionsContract objects"""
-    contracts = []
-    for _, row in df.iterrows():
-        try:
-            contract = OptionsContract(
-                symbol=row.get('symbol', 'SPX'),
-                strike=float(row['strike']),
-                expiry_date=pd.to_datetime(row['expiry_date']),
-                option_type=str(row['option_type']).lower(),
-                open_interest=int(row.get('open_interest', 0)),
-                volume=int(row.get('volume', 0)),
-                bid=float(row.get('bid', 0.0)),
-                ask=float(row.get('ask', 0.0)),
-                last_price=float(row.get('last_price', 0.0)),
-                implied_volatility=float(row.get('implied_volatility', 0.2))
+@dataclass
+class TickerSnapshot:
+    """Price and option expirations for a symbol, fetched from a single Ticker"""
+    symbol: str
+    current_price: Optional[float]
+    expirations: List[str]
+    price_error: Optional[str] = None
+    expirations_error: Optional[str] = None
+    
+    @property
+    def has_options(self) -> bool:
+        """True if the symbol has at least one option expiration"""
+        return len(self.expirations) > 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            'symbol': self.symbol,
+            'current_price': self.current_price,
+            'expirations': list(self.expirations),
+            'price_error': self.price_error,
+            'expirations_error': self.expirations_error
+        }
+
+
+def _column_values(df: pd.DataFrame, column: str, default: Any = None, integer: bool = False) -> np.ndarray:
+    """
+    A DataFrame column as a NumPy array, coerced like float()/int() on each cell
+    
+    Args:
+        df: Options data DataFrame
+        column: Column name
+        default: Value for every row when the column is missing (KeyError if None)
+        integer: Truncate to int64; missing values raise ValueError as int() would
+    
+    Returns:
+        float64 or int64 array with one element per row
+    """
+    if column not in df.columns:
+        if default is None:
+            raise KeyError(column)
+        return np.full(len(df), default, dtype=np.int64 if integer else np.float64)
+    
+    values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    if not integer:
+        return values
+    missing = np.isnan(values)
+    if missing.any():
+        raise ValueError(f"cannot convert NaN {column} to integer (row {df.index[np.argmax(missing)]})")
+    return values.astype(np.int64)
+
+
+@dataclass
+class OptionsChainSoA:
+    """
+    Options chain stored column-wise (struct of arrays), one element per contract
+    
+    Numeric code reads the arrays directly; indexing or iterating yields
+    OptionsContract objects for code written against the list form.
+    """
+    symbol: np.ndarray
+    strike: np.ndarray  # float64
+    expiry_date: np.ndarray  # datetime64[ns]
+    is_call: np.ndarray  # bool
+    open_interest: np.ndarray  # int64
+    volume: np.ndarray  # int64
+    bid: np.ndarray
+    ask: np.ndarray
+    last_price: np.ndarray
+    implied_volatility: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.strike)
+    
+    def __getitem__(self, i: int) -> OptionsContract:
+        """Contract ``i`` as an OptionsContract"""
+        return OptionsContract._from_validated(
+            self.symbol[i], float(self.strike[i]), pd.Timestamp(self.expiry_date[i]),
+            'call' if self.is_call[i] else 'put', int(self.open_interest[i]), int(self.volume[i]),
+            float(self.bid[i]), float(self.ask[i]), float(self.last_price[i]), float(self.implied_volatility[i])
+        )
+    
+    def __iter__(self):
+        return iter(self.to_contracts())
+    
+    def to_contracts(self) -> List[OptionsContract]:
+        """Convert to a list of OptionsContract objects"""
+        # A chain has a handful of expiries: build one Timestamp per distinct date and
+        # share it (and the two type strings) across rows instead of one object per row
+        expiry_codes, expiry_dates = pd.factorize(self.expiry_date)
+        expiries = np.array(pd.DatetimeIndex(expiry_dates).tolist() + [pd.NaT], dtype=object)[expiry_codes]
+        option_types = np.array(['put', 'call'], dtype=object)[self.is_call.astype(np.intp)]
+        
+        # tolist() yields Python floats and ints, as float()/int() on each cell would
+        return [
+            OptionsContract._from_validated(*values)
+            for values in zip(
+                self.symbol.tolist(), self.strike.tolist(), expiries.tolist(),
+                option_types.tolist(), self.open_interest.tolist(), self.volume.tolist(),
+                self.bid.tolist(), self.ask.tolist(), self.last_price.tolist(), self.implied_volatility.tolist()
             )
-            contracts.append(contract)
-        except (ValueError, KeyError) as e:
-            raise ValueError(f"Error processing row {row.name}: {e}")
+        ]
+    
+    def to_arrays(self, dtype=np.float64) -> Dict[str, np.ndarray]:
+        """Same arrays as OptionsContract.to_arrays, taken from the columns without copying where possible"""
+        return {
+            'strike': self.strike.astype(dtype, copy=False),
+            'iv': self.implied_volatility.astype(dtype, copy=False),
+            'oi': self.open_interest,
+            'expiry': self.expiry_date,
+            'is_call': self.is_call
+        }
     
-    return contracts
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, default_symbol: str = 'SPX',
+                       drop_invalid: bool = False) -> 'OptionsChainSoA':
+        """
+        Build a chain from an options DataFrame, validating every row at once
+        
+        Args:
+            df: Options data DataFrame (missing optional columns get the usual defaults)
+            default_symbol: Symbol used when the DataFrame has no symbol column
+            drop_invalid: Leave out rows that cannot be converted or fail validation
+                instead of raising
+            
+        Returns:
+            OptionsChainSoA with one element per (kept) row
+            
+        Raises:
+            ValueError: If a row cannot be converted or fails OptionsContract validation
+                (only when drop_invalid is False)
+        """
+        if drop_invalid and not df.empty:
+            df = df[cls._convertible_rows(df)]
+        if df.empty:
+            return cls(np.empty(0, dtype=object), np.empty(0), np.empty(0, dtype='datetime64[ns]'),
+                       np.empty(0, dtype=np.bool_), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64),
+                       np.empty(0), np.empty(0), np.empty(0), np.empty(0))
+        
+        # Coerce each column once instead of boxing every cell through iterrows()
+        try:
+            strikes = _column_values(df, 'strike')
+            option_types = df['option_type'].astype(str).str.lower().to_numpy()
+            expiries = df['expiry_date']
+            if expiries.dtype.kind != 'M':
+                # 'mixed' parses every value on its own, as a per-row pd.to_datetime does
+                expiries = pd.to_datetime(expiries, format='mixed')
+            if expiries.dt.tz is not None:
+                expiries = expiries.dt.tz_localize(None)
+            expiries = expiries.to_numpy(dtype='datetime64[ns]')
+            open_interest = _column_values(df, 'open_interest', 0, integer=True)
+            volume = _column_values(df, 'volume', 0, integer=True)
+            bid = _column_values(df, 'bid', 0.0)
+            ask = _column_values(df, 'ask', 0.0)
+            last_price = _column_values(df, 'last_price', 0.0)
+            iv = _column_values(df, 'implied_volatility', 0.2)
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Error processing rows: {e}")
+        if 'symbol' in df.columns:
+            symbols = df['symbol'].to_numpy(dtype=object)
+        else:
+            symbols = np.full(len(df), default_symbol, dtype=object)
+        
+        # Validate the whole frame at once so contracts built from it can skip __post_init__
+        invalid = ~np.isin(option_types, ('call', 'put')) | (strikes <= 0) | (open_interest < 0) | (iv < 0)
+        if drop_invalid and invalid.any():
+            keep = ~invalid
+            return cls(symbols[keep], strikes[keep], expiries[keep], option_types[keep] == 'call',
+                       open_interest[keep], volume[keep], bid[keep], ask[keep], last_price[keep], iv[keep])
+        if invalid.any():
+            # Build the first bad row the validating way to report its exact error
+            i = int(np.argmax(invalid))
+            try:
+                OptionsContract(symbols[i], float(strikes[i]), pd.Timestamp(expiries[i]), option_types[i],
+                                int(open_interest[i]), int(volume[i]), float(bid[i]), float(ask[i]),
+                                float(last_price[i]), float(iv[i]))
+            except ValueError as e:
+                raise ValueError(f"Error processing row {df.index[i]}: {e}")
+        
+        return cls(symbols, strikes, expiries, option_types == 'call', open_interest, volume,
+                   bid, ask, last_price, iv)
+    
+    @staticmethod
+    def _convertible_rows(df: pd.DataFrame) -> np.ndarray:
+        """Mask of rows whose counts are not missing and whose expiry parses, i.e. rows int()/to_datetime accept"""
+        keep = np.ones(len(df), dtype=np.bool_)
+        for column in ('open_interest', 'volume'):
+            if column in df.columns:
+                keep &= df[column].notna().to_numpy()
+        if 'expiry_date' in df.columns and df['expiry_date'].dtype.kind != 'M':
+            parsed = pd.to_datetime(df['expiry_date'], format='mixed', errors='coerce')
+            keep &= (parsed.notna() | df['expiry_date'].isna()).to_numpy()
+        return keep
 
 
-def options_contracts_to_dataframe(contracts: list[OptionsContract]) -> pd.DataFrame:
-    """Convert list of OptionsContract objects to DataFrame"""
-    data = [contract.to_dict() for contract in contracts]
-    df = pd.DataFrame(data)
-    if not df.empty:
-        df['expiry_date'] = pd.to_datetime(df['expiry_date'])
-    return df
\ No newline at end of file
+def dataframe_to_options_contracts(df: pd.DataFrame) -> list[OptionsContract]:
+    """Convert DataFrame to list of OptionsContract objects"""
+    return OptionsChainSoA.from_dataframe(df).to_contracts()
+
+
+def options_contracts_to_dataframe(contracts) -> pd.DataFrame:
+    """Convert a list of OptionsContract objects or an OptionsChainSoA to DataFrame"""
+    if isinstance(contracts, OptionsChainSoA):
+        return pd.DataFrame({
+            'symbol': contracts.symbol,
+            'strike': contracts.strike,
+            'expiry_date': contracts.expiry_date,
+            'option_type': np.where(contracts.is_call, 'call', 'put').astype(object),
+            'open_interest': contracts.open_interest,
+            'volume': contracts.volume,
+            'bid': contracts.bid,
+            'ask': contracts.ask,
+            'last_price': contracts.last_price,
+            'implied_volatility': contracts.implied_volatility
+        })
+    
+    if not contracts:
+        return pd.DataFrame()
+    
+    # Read the attributes straight into columns: no to_dict(), isoformat() or re-parsing
+    n = len(contracts)
+    return pd.DataFrame({
+        'symbol': [c.symbol for c in contracts],
+        'strike': np.fromiter((c.strike for c in contracts), dtype=np.float64, count=n),
+        'expiry_date': np.array([c.expiry_date for c in contracts], dtype='datetime64[ns]'),
+        'option_type': [c.option_type for c in contracts],
+        'open_interest': np.fromiter((c.open_interest for c in contracts), dtype=np.int64, count=n),
+        'volume': np.fromiter((c.volume for c in contracts), dtype=np.int64, count=n),
+        'bid': np.fromiter((c.bid for c in contracts), dtype=np.float64, count=n),
+        'ask': np.fromiter((c.ask for c in contracts), dtype=np.float64, count=n),
+        'last_price': np.fromiter((c.last_price for c in contracts), dtype=np.float64, count=n),
+        'implied_volatility': np.fromiter((c.implied_volatility for c in contracts), dtype=np.float64, count=n)
+    })
@@ -10,7 +10,90 @@ import io
 from pathlib import Path
 
 from .models import OptionsContract, dataframe_to_options_contracts
-from app_config import SUPPORTED_FILE_TYPES, MAX_FILE_SIZE_MB
+from app_config import SUPPORTED_FILE_TYPES, MAX_FILE_SIZE_MB, CSV_CHUNK_ROWS
+
+# pyarrow's multithreaded CSV parser is used when installed, pandas otherwise
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Cells pandas.read_csv reads as missing by default, so the pyarrow path nulls the same ones
+PANDAS_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null'
+]
+
+# Numba is optional: the validation sweep falls back to NumPy masks without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _normalize_labels(labels: pd.Series) -> pd.Series:
+    """
+    Lower-case and strip a column of labels such as option types
+    
+    A chain holds only a handful of distinct spellings ('call', 'CALL', ' Put'...),
+    so the string methods run on the distinct values and the rows are mapped back
+    through their factorize codes.
+    """
+    codes, uniques = pd.factorize(labels)
+    normalized = pd.Index(uniques).str.lower().str.strip().to_numpy(dtype=object)
+    values = np.empty(len(labels), dtype=object)
+    values[:] = np.nan
+    found = codes >= 0
+    values[found] = normalized[codes[found]]
+    return pd.Series(values, index=labels.index, name=labels.name)
+
+
+# int64 view of NaT in a datetime64[ns] array
+_NAT_NS = np.iinfo(np.int64).min
+
+
+def _count_invalid_numpy(strikes, open_interest, type_codes, expiry_ns, today_ns):
+    """NumPy version of the validation sweep: counts of bad strikes, types, open interest, dates and past expiries"""
+    has_date = expiry_ns != _NAT_NS
+    return (
+        int((~(strikes > 0)).sum()),
+        int((type_codes < 0).sum()),
+        int((~(open_interest >= 0)).sum()),
+        int((~has_date).sum()),
+        int((has_date & (expiry_ns < today_ns)).sum())
+    )
+
+
+if NUMBA_AVAILABLE:
+    # Serial for the same reason as the gamma kernels: Streamlit calls this from worker threads
+    @njit(cache=True)
+    def _count_invalid_numba(strikes, open_interest, type_codes, expiry_ns, today_ns):
+        """Numba version of the validation sweep: every rule checked in one pass over the rows"""
+        bad_strike = 0
+        bad_type = 0
+        bad_oi = 0
+        bad_date = 0
+        past = 0
+        for i in range(strikes.shape[0]):
+            # 'not x > 0' also catches NaN
+            if not strikes[i] > 0:
+                bad_strike += 1
+            if type_codes[i] < 0:
+                bad_type += 1
+            if not open_interest[i] >= 0:
+                bad_oi += 1
+            if expiry_ns[i] == _NAT_NS:
+                bad_date += 1
+            elif expiry_ns[i] < today_ns:
+                past += 1
+        return bad_strike, bad_type, bad_oi, bad_date, past
+    
+    _count_invalid = _count_invalid_numba
+else:
+    _count_invalid = _count_invalid_numpy
 
 
 class DataValidationError(Exception):
@@ -29,6 +112,11 @@ class OptionsDataProcessor:
         'symbol', 'volume', 'bid', 'ask', 'last_price', 'implied_volatility'
     ]
     
+    # Defaults for missing values in the optional numeric columns (IV: 20% volatility)
+    OPTIONAL_DEFAULTS = {
+        'volume': 0, 'bid': 0.0, 'ask': 0.0, 'last_price': 0.0, 'implied_volatility': 0.2
+    }
+    
     def __init__(self):
         self.last_loaded_data: Optional[pd.DataFrame] = None
         self.validation_errors: List[str] = []
@@ -47,6 +135,8 @@ class OptionsDataProcessor:
             DataValidationError: If file format is invalid or data cannot be loaded
         """
         try:
+            validated = False
+            
             # Handle different input types
             if isinstance(file_path_or_buffer, (str, Path)):
                 file_path = Path(file_path_or_buffer)
@@ -60,8 +150,12 @@ class OptionsDataProcessor:
                 
                 # Load based on file extension
                 suffix = file_path.suffix.lower()
-                if suffix == '.csv':
-                    df = pd.read_csv(file_path)
+                if suffix == '.csv' and file_size_mb > MAX_FILE_SIZE_MB / 2:
+                    # Large files are validated chunk by chunk as they are read
+                    df = self._read_csv_chunked(file_path)
+                    validated = True
+                elif suffix == '.csv':
+                    df = self._read_csv(file_path)
                 elif suffix in ['.xlsx', '.xls']:
                     df = pd.read_excel(file_path)
                 else:
@@ -71,7 +165,7 @@ class OptionsDataProcessor:
                 # Assume it's a file-like buffer
                 try:
                     # Try CSV first
-                    df = pd.read_csv(file_path_or_buffer)
+                    df = self._read_csv(file_path_or_buffer)
                 except:
                     # Reset buffer position and try Excel
                     if hasattr(file_path_or_buffer, 'seek'):
@@ -79,8 +173,9 @@ class OptionsDataProcessor:
                     df = pd.read_excel(file_path_or_buffer)
             
             # Validate and clean the data
-            df = self.validate_data_format(df)
-            df = self.clean_and_normalize(df)
+            if not validated:
+                df = self.validate_data_format(df)
+            df = self.clean_and_normalize(df, prevalidated=validated)
             
             self.last_loaded_data = df
             return df
@@ -91,6 +186,91 @@ class OptionsDataProcessor:
             else:
                 raise DataValidationError(f"Error loading data: {str(e)}")
     
+    def _read_csv(self, source) -> pd.DataFrame:
+        """
+        Read a CSV file or buffer, preferring pyarrow's parser
+        
+        Args:
+            source: File path or file-like buffer
+            
+        Returns:
+            pd.DataFrame: Parsed CSV data
+        """
+        if PYARROW_AVAILABLE:
+            try:
+                # Declare every known column so the parser skips type inference for them;
+                # counts are float64 so blank cells load as NaN rather than failing.
+                # Blank and NA-like string cells must be null too, as they are with pandas.
+                convert_options = pa_csv.ConvertOptions(
+                    strings_can_be_null=True,
+                    null_values=PANDAS_NA_VALUES,
+                    column_types={
+                        'symbol': pa.string(),
+                        'strike': pa.float64(),
+                        'option_type': pa.string(),
+                        'open_interest': pa.float64(),
+                        'volume': pa.float64(),
+                        'bid': pa.float64(),
+                        'ask': pa.float64(),
+                        'last_price': pa.float64(),
+                        'implied_volatility': pa.float64()
+                    }
+                )
+                source_arg = str(source) if isinstance(source, Path) else source
+                table = pa_csv.read_csv(source_arg, convert_options=convert_options)
+                return table.to_pandas(self_destruct=True)
+            except (pa.ArrowException, UnicodeDecodeError):
+                # Let pandas have a go at anything pyarrow cannot parse
+                if hasattr(source, 'seek'):
+                    source.seek(0)
+        
+        return pd.read_csv(source)
+    
+    def _read_csv_chunked(self, file_path: Path) -> pd.DataFrame:
+        """
+        Read and validate a large CSV file in chunks of CSV_CHUNK_ROWS rows
+        
+        Each chunk is coerced and checked like validate_data_format, then has the
+        rows clean_and_normalize would remove dropped and the rest cleaned before
+        the chunks are joined, so the parser's buffers only ever hold one chunk and
+        only the compact cleaned columns are kept. Validation warnings are summed
+        over the chunks and reported once. Pass the result to clean_and_normalize
+        with prevalidated=True.
+        
+        Args:
+            file_path: Path to the CSV file
+            
+        Returns:
+            pd.DataFrame: Validated and cleaned, but unsorted, options data
+        """
+        counts = np.zeros(5, dtype=np.int64)
+        removed = 0
+        chunks = []
+        
+        with pd.read_csv(file_path, chunksize=CSV_CHUNK_ROWS) as reader:
+            for chunk in reader:
+                self._check_required_columns(chunk)
+                chunk, chunk_counts = self._coerce_and_count_invalid(chunk)
+                counts += chunk_counts
+                
+                critical_missing = self._critical_missing(chunk)
+                if critical_missing.any():
+                    removed += int(critical_missing.sum())
+                    chunk = chunk[~critical_missing]
+                chunks.append(self._clean_rows(chunk))
+        
+        self._report_validation(counts)
+        if removed:
+            print(f"Removing {removed} rows with critical missing data")
+        
+        # Give every chunk the same option_type categories so the concat keeps the categorical
+        categories = sorted(set().union(*(chunk['option_type'].cat.categories for chunk in chunks)))
+        for chunk in chunks:
+            chunk['option_type'] = chunk['option_type'].cat.set_categories(categories)
+        df = pd.concat(chunks, ignore_index=True)
+        chunks.clear()
+        return df
+    
     def validate_data_format(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Validate that DataFrame has required columns and data types
@@ -105,7 +285,13 @@ class OptionsDataProcessor:
             DataValidationError: If validation fails
         """
         self.validation_errors = []
-        
+        self._check_required_columns(df)
+        df, counts = self._coerce_and_count_invalid(df)
+        self._report_validation(counts)
+        return df
+    
+    def _check_required_columns(self, df: pd.DataFrame):
+        """Raise DataValidationError if the data is empty or lacks a required column"""
         if df.empty:
             raise DataValidationError("Data file is empty")
         
@@ -113,132 +299,161 @@ class OptionsDataProcessor:
         missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
         if missing_columns:
             raise DataValidationError(f"Missing required columns: {missing_columns}")
+    
+    def _coerce_and_count_invalid(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Coerce the required columns to their types and count rows breaking each rule
         
+        Args:
+            df: Input DataFrame with the required columns (modified in place)
+            
+        Returns:
+            Tuple of the DataFrame and an int64 array of invalid strike, option type,
+            open interest and expiry date counts followed by the past expiry count
+        """
         # Validate data types and ranges
         try:
             # Strike prices must be positive numbers
-            if not pd.api.types.is_numeric_dtype(df['strike']):
+            if df['strike'].dtype.kind not in 'iuf':
                 df['strike'] = pd.to_numeric(df['strike'], errors='coerce')
             
-            invalid_strikes = df['strike'].isna() | (df['strike'] <= 0)
-            if invalid_strikes.any():
-                self.validation_errors.append(f"Invalid strike prices found in {invalid_strikes.sum()} rows")
-            
             # Option type must be 'call' or 'put'
-            df['option_type'] = df['option_type'].str.lower().str.strip()
-            invalid_types = ~df['option_type'].isin(['call', 'put'])
-            if invalid_types.any():
-                self.validation_errors.append(f"Invalid option types found in {invalid_types.sum()} rows")
+            df['option_type'] = _normalize_labels(df['option_type'])
             
             # Open interest must be non-negative integers
-            if not pd.api.types.is_numeric_dtype(df['open_interest']):
+            if df['open_interest'].dtype.kind not in 'iuf':
                 df['open_interest'] = pd.to_numeric(df['open_interest'], errors='coerce')
             
-            invalid_oi = df['open_interest'].isna() | (df['open_interest'] < 0)
-            if invalid_oi.any():
-                self.validation_errors.append(f"Invalid open interest values found in {invalid_oi.sum()} rows")
-            
             # Expiry date validation
-            if not pd.api.types.is_datetime64_any_dtype(df['expiry_date']):
+            if df['expiry_date'].dtype.kind != 'M':
                 df['expiry_date'] = pd.to_datetime(df['expiry_date'], errors='coerce')
             
-            invalid_dates = df['expiry_date'].isna()
-            if invalid_dates.any():
-                self.validation_errors.append(f"Invalid expiry dates found in {invalid_dates.sum()} rows")
-            
-            # Check for future expiry dates
+            # Count every rule's failures in one sweep instead of one boolean Series per rule
+            option_types = df['option_type'].to_numpy()
+            type_codes = np.where(option_types == 'call', 0, np.where(option_types == 'put', 1, -1)).astype(np.int8)
             today = pd.Timestamp.now().normalize()
-            past_dates = df['expiry_date'] < today
-            if past_dates.any():
-                self.validation_errors.append(f"Past expiry dates found in {past_dates.sum()} rows")
-            
+            counts = _count_invalid(
+                df['strike'].to_numpy(dtype=np.float64, na_value=np.nan),
+                df['open_interest'].to_numpy(dtype=np.float64, na_value=np.nan),
+                type_codes,
+                df['expiry_date'].to_numpy(dtype='datetime64[ns]').view(np.int64),
+                np.int64(today.value)
+            )
         except Exception as e:
             raise DataValidationError(f"Data type validation failed: {str(e)}")
         
+        return df, np.array(counts, dtype=np.int64)
+    
+    def _report_validation(self, counts: np.ndarray):
+        """Record and print the validation warnings for counts from _coerce_and_count_invalid"""
+        invalid_strikes, invalid_types, invalid_oi, invalid_dates, past_dates = (int(c) for c in counts)
+        self.validation_errors = []
+        
+        if invalid_strikes:
+            self.validation_errors.append(f"Invalid strike prices found in {invalid_strikes} rows")
+        if invalid_types:
+            self.validation_errors.append(f"Invalid option types found in {invalid_types} rows")
+        if invalid_oi:
+            self.validation_errors.append(f"Invalid open interest values found in {invalid_oi} rows")
+        if invalid_dates:
+            self.validation_errors.append(f"Invalid expiry dates found in {invalid_dates} rows")
+        
+        # Check for future expiry dates
+        if past_dates:
+            self.validation_errors.append(f"Past expiry dates found in {past_dates} rows")
+        
         # Report validation errors but don't fail unless critical
         if self.validation_errors:
             error_summary = "; ".join(self.validation_errors)
             # For now, just warn - in production might want to be stricter
             print(f"Data validation warnings: {error_summary}")
-        
-        return df
     
-    def clean_and_normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def _critical_missing(df: pd.DataFrame) -> pd.Series:
+        """Mask of rows without a usable strike, option type or expiry date"""
+        return (
+            df['strike'].isna() | 
+            df['option_type'].isna() | 
+            df['expiry_date'].isna() |
+            (df['strike'] <= 0)
+        )
+    
+    def clean_and_normalize(self, df: pd.DataFrame, prevalidated: bool = False) -> pd.DataFrame:
         """
         Clean and normalize the data
         
         Args:
             df: Input DataFrame
+            prevalidated: df comes from _read_csv_chunked, which already removed
+                and cleaned rows chunk by chunk; only the sort is left to do
             
         Returns:
             pd.DataFrame: Cleaned DataFrame
         """
-        df = df.copy()
+        if not prevalidated:
+            df = df.copy()
+            
+            # Remove rows with critical missing data
+            critical_missing = self._critical_missing(df)
+            
+            if critical_missing.any():
+                print(f"Removing {critical_missing.sum()} rows with critical missing data")
+                df = df[~critical_missing]
+            
+            df = self._clean_rows(df)
         
-        # Remove rows with critical missing data
-        critical_missing = (
-            df['strike'].isna() | 
-            df['option_type'].isna() | 
-            df['expiry_date'].isna() |
-            (df['strike'] <= 0)
-        )
+        # Sort by strike and option type for consistency; one stable lexsort over the
+        # float strikes and int8 category codes (categories are in alphabetical order)
+        order = np.lexsort((df['option_type'].cat.codes.to_numpy(), df['strike'].to_numpy()))
+        df = df.iloc[order].reset_index(drop=True)
         
-        if critical_missing.any():
-            print(f"Removing {critical_missing.sum()} rows with critical missing data")
-            df = df[~critical_missing]
-        
-        # Fill optional columns with defaults
-        if 'symbol' not in df.columns:
-            df['symbol'] = 'SPX'
-        
-        if 'volume' not in df.columns:
-            df['volume'] = 0
-        else:
-            df['volume'] = df['volume'].fillna(0)
-        
-        if 'bid' not in df.columns:
-            df['bid'] = 0.0
-        else:
-            df['bid'] = df['bid'].fillna(0.0)
-        
-        if 'ask' not in df.columns:
-            df['ask'] = 0.0
-        else:
-            df['ask'] = df['ask'].fillna(0.0)
-        
-        if 'last_price' not in df.columns:
-            df['last_price'] = 0.0
-        else:
-            df['last_price'] = df['last_price'].fillna(0.0)
-        
-        if 'implied_volatility' not in df.columns:
-            df['implied_volatility'] = 0.2  # Default 20% volatility
-        else:
-            df['implied_volatility'] = df['implied_volatility'].fillna(0.2)
-            
-            # IV Normalization Strategy:
-            # Yahoo Finance returns IV as decimal (0.25 = 25%, 1.5 = 150%)
-            # Some sources may return as percentage (25 = 25%, 150 = 150%)
-            # 
-            # Decision logic:
-            # - If IV > 10: Definitely a percentage, divide by 100 (e.g., 25 → 0.25, 150 → 1.50)
-            # - If IV <= 10: Already in decimal format, use as-is (e.g., 0.25, 1.5, 2.0)
-            #
-            # Rationale: IV rarely exceeds 1000%, so any value > 10 must be a percentage
-            # Values 0-10 are treated as decimals since they represent 0-1000% IV range
+        return df
+    
+    def _clean_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fill defaults and set the compact column types; each row is cleaned on its own
+        
+        Args:
+            df: DataFrame without critical missing rows
             
-            # # Apply normalization only to values > 10
-            # mask = df['implied_volatility'] > 10.0
-            # if mask.any():
-            #     print(f"Normalizing {mask.sum()} IV values from percentage to decimal")
-            #     df.loc[mask, 'implied_volatility'] = df.loc[mask, 'implied_volatility'] / 100.0
+        Returns:
+            pd.DataFrame: Cleaned DataFrame, in its original row order
+        """
+        # Add every missing optional column with its default in one assign (IV: 20% volatility)
+        columns = set(df.columns)
+        missing = {col: value for col, value in {'symbol': 'SPX', **self.OPTIONAL_DEFAULTS}.items()
+                   if col not in columns}
+        if missing:
+            df = df.assign(**missing)
+        
+        # Fill missing values only in columns that have some; fillna copies every column it is given
+        fill = {col: value for col, value in {**self.OPTIONAL_DEFAULTS, 'open_interest': 0}.items()
+                if df[col].isna().any()}
+        if fill:
+            df = df.fillna(fill)
+        
+        # IV Normalization Strategy:
+        # Yahoo Finance returns IV as decimal (0.25 = 25%, 1.5 = 150%)
+        # Some sources may return as percentage (25 = 25%, 150 = 150%)
+        # 
+        # Decision logic:
+        # - If IV > 10: Definitely a percentage, divide by 100 (e.g., 25 → 0.25, 150 → 1.50)
+        # - If IV <= 10: Already in decimal format, use as-is (e.g., 0.25, 1.5, 2.0)
+        #
+        # Rationale: IV rarely exceeds 1000%, so any value > 10 must be a percentage
+        # Values 0-10 are treated as decimals since they represent 0-1000% IV range
+        
+        # # Apply normalization only to values > 10
+        # mask = df['implied_volatility'] > 10.0
+        # if mask.any():
+        #     print(f"Normalizing {mask.sum()} IV values from percentage to decimal")
+        #     df.loc[mask, 'implied_volatility'] = df.loc[mask, 'implied_volatility'] / 100.0
         
-        # Ensure open interest is integer
-        df['open_interest'] = df['open_interest'].fillna(0).astype(int)
-        df['volume'] = df['volume'].astype(int)
+        # Ensure counts are integers; int32 holds any real open interest or volume
+        df = df.astype({'open_interest': np.int32, 'volume': np.int32})
         
-        # Sort by strike and option type for consistency
-        df = df.sort_values(['strike', 'option_type']).reset_index(drop=True)
+        # Two distinct values: a categorical stores one byte per row and compares on its codes
+        df['option_type'] = df['option_type'].astype('category')
         
         return df
     
@@ -255,21 +470,26 @@ class OptionsDataProcessor:
         if df.empty:
             return {"error": "No data available"}
         
+        # One aggregation call per column; value_counts is a single bincount on a categorical
+        strike_stats = df['strike'].agg(['min', 'max', 'nunique'])
+        expiry_stats = df['expiry_date'].agg(['min', 'max', 'nunique'])
+        type_counts = df['option_type'].value_counts().reindex(['call', 'put'], fill_value=0)
+        
         summary = {
             "total_contracts": len(df),
-            "unique_strikes": df['strike'].nunique(),
+            "unique_strikes": int(strike_stats['nunique']),
             "strike_range": {
-                "min": float(df['strike'].min()),
-                "max": float(df['strike'].max())
+                "min": float(strike_stats['min']),
+                "max": float(strike_stats['max'])
             },
             "expiry_dates": {
-                "min": df['expiry_date'].min().strftime('%Y-%m-%d'),
-                "max": df['expiry_date'].max().strftime('%Y-%m-%d'),
-                "unique_count": df['expiry_date'].nunique()
+                "min": expiry_stats['min'].strftime('%Y-%m-%d'),
+                "max": expiry_stats['max'].strftime('%Y-%m-%d'),
+                "unique_count": int(expiry_stats['nunique'])
             },
             "option_types": {
-                "calls": int((df['option_type'] == 'call').sum()),
-                "puts": int((df['option_type'] == 'put').sum())
+                "calls": int(type_counts['call']),
+                "puts": int(type_counts['put'])
             },
             "total_open_interest": int(df['open_interest'].sum()),
             "avg_implied_volatility": float(df['implied_volatility'].mean()),
@@ -296,7 +516,8 @@ class OptionsDataProcessor:
     def create_sample_data(self, 
                           spot_price: float = 4500, 
                           num_strikes: int = 20,
-                          days_to_expiry: int = 30) -> pd.DataFrame:
+                          days_to_expiry: int = 30,
+                          seed: Optional[int] = None) -> pd.DataFrame:
         """
         Create sample options data for testing
         
@@ -304,43 +525,32 @@ class OptionsDataProcessor:
             spot_price: Current SPX price
             num_strikes: Number of strike prices to generate
             days_to_expiry: Days until expiration
+            seed: Random seed for reproducible data (fresh randomness if None)
             
         Returns:
-            pd.DataFrame: Sample options data
+            pd.DataFrame: Sample options data, a call and a put row per strike
         """
+        rng = np.random.default_rng(seed)
+        
         # Generate strikes around current price
         strike_range = np.linspace(spot_price * 0.9, spot_price * 1.1, num_strikes)
-        
-        data = []
         expiry_date = datetime.now() + pd.Timedelta(days=days_to_expiry)
         
-        for strike in strike_range:
-            # Create call option
-            data.append({
-                'symbol': 'SPX',
-                'strike': round(strike),
-                'expiry_date': expiry_date,
-                'option_type': 'call',
-                'open_interest': np.random.randint(100, 5000),
-                'volume': np.random.randint(0, 1000),
-                'bid': max(0.1, spot_price - strike + np.random.normal(0, 10)),
-                'ask': max(0.2, spot_price - strike + np.random.normal(0, 10) + 0.5),
-                'last_price': max(0.15, spot_price - strike + np.random.normal(0, 10) + 0.25),
-                'implied_volatility': max(0.1, np.random.normal(0.2, 0.05))
-            })
-            
-            # Create put option
-            data.append({
-                'symbol': 'SPX',
-                'strike': round(strike),
-                'expiry_date': expiry_date,
-                'option_type': 'put',
-                'open_interest': np.random.randint(100, 5000),
-                'volume': np.random.randint(0, 1000),
-                'bid': max(0.1, strike - spot_price + np.random.normal(0, 10)),
-                'ask': max(0.2, strike - spot_price + np.random.normal(0, 10) + 0.5),
-                'last_price': max(0.15, strike - spot_price + np.random.normal(0, 10) + 0.25),
-                'implied_volatility': max(0.1, np.random.normal(0.2, 0.05))
-            })
-        
-        return pd.DataFrame(data)
\ No newline at end of file
+        # Rows alternate call, put for each strike; intrinsic value is spot - strike for calls
+        n = 2 * num_strikes
+        strikes = np.repeat(strike_range, 2)
+        is_call = np.tile([True, False], num_strikes)
+        intrinsic = np.where(is_call, spot_price - strikes, strikes - spot_price)
+        
+        return pd.DataFrame({
+            'symbol': 'SPX',
+            'strike': np.round(strikes).astype(np.int64),
+            'expiry_date': expiry_date,
+            'option_type': np.where(is_call, 'call', 'put'),
+            'open_interest': rng.integers(100, 5000, n),
+            'volume': rng.integers(0, 1000, n),
+            'bid': np.maximum(0.1, intrinsic + rng.normal(0, 10, n)),
+            'ask': np.maximum(0.2, intrinsic + rng.normal(0, 10, n) + 0.5),
+            'last_price': np.maximum(0.15, intrinsic + rng.normal(0, 10, n) + 0.25),
+            'implied_volatility': np.maximum(0.1, rng.normal(0.2, 0.05, n))
+        })
\ No newline at end of file
@@ -2,13 +2,19 @@
 Yahoo Finance data fetcher for options chain data
 """
 
+import threading
+import time
 import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 
-from .models import OptionsContract
+from app_config import YF_MAX_CONCURRENT_REQUESTS, YF_PRICE_BATCH_SIZE, YF_REQUESTS_PER_SECOND
+from app_config import PRICE_CACHE_TTL, EXPIRATIONS_CACHE_TTL, TICKER_CACHE_TTL
+from .cache import MemoryCache
+from .models import OptionsContract, OptionsChainSoA, TickerSnapshot
 
 
 class YFinanceFetchError(Exception):
@@ -16,32 +22,119 @@ class YFinanceFetchError(Exception):
     pass
 
 
+# Popular symbols for quick selection (display symbol -> Yahoo Finance symbol)
+POPULAR_SYMBOLS = {
+    'SPX': '^SPX',  # S&P 500 Index
+    'SPY': 'SPY',   # SPDR S&P 500 ETF
+    'QQQ': 'QQQ',   # Invesco QQQ Trust
+    'IWM': 'IWM',   # iShares Russell 2000 ETF
+    'VIX': '^VIX',  # CBOE Volatility Index
+    'DIA': 'DIA',   # Dow Jones Industrial Average ETF
+    'AAPL': 'AAPL', # Apple Inc.
+    'MSFT': 'MSFT', # Microsoft Corporation
+    'TSLA': 'TSLA', # Tesla Inc.
+    'NVDA': 'NVDA', # NVIDIA Corporation
+    'AMZN': 'AMZN', # Amazon.com Inc.
+    'GOOGL': 'GOOGL', # Alphabet Inc.
+    'META': 'META', # Meta Platforms Inc.
+}
+
+# option_type holds two values, so it is stored as a categorical (one byte per row)
+OPTION_TYPE_DTYPE = pd.CategoricalDtype(['call', 'put'])
+
+# Prices and expiration lists shared by all fetchers, keyed by (kind, Yahoo symbol)
+_QUOTE_CACHE = MemoryCache()
+
+
+class _RateLimiter:
+    """Token bucket spacing out requests so bursts do not trigger Yahoo's 429 responses"""
+    
+    def __init__(self, rate: float):
+        """
+        Initialize the limiter
+        
+        Args:
+            rate: Sustained requests per second (also the burst size)
+        """
+        self.rate = rate
+        self._tokens = rate
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # A negative balance reserves a future token, so waiting threads queue up in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# One limiter for every fetcher in the process, taken before each Yahoo request
+_YAHOO_LIMITER = _RateLimiter(YF_REQUESTS_PER_SECOND)
+
+
 class YFinanceOptionsFetcher:
     """Fetches options chain data from Yahoo Finance"""
     
-    def __init__(self):
-        """Initialize the fetcher"""
-        # Popular symbols for quick selection
-        self.popular_symbols = {
-            'SPX': '^SPX',  # S&P 500 Index
-            'SPY': 'SPY',   # SPDR S&P 500 ETF
-            'QQQ': 'QQQ',   # Invesco QQQ Trust
-            'IWM': 'IWM',   # iShares Russell 2000 ETF
-            'VIX': '^VIX',  # CBOE Volatility Index
-            'DIA': 'DIA',   # Dow Jones Industrial Average ETF
-            'AAPL': 'AAPL', # Apple Inc.
-            'MSFT': 'MSFT', # Microsoft Corporation
-            'TSLA': 'TSLA', # Tesla Inc.
-            'NVDA': 'NVDA', # NVIDIA Corporation
-            'AMZN': 'AMZN', # Amazon.com Inc.
-            'GOOGL': 'GOOGL', # Alphabet Inc.
-            'META': 'META', # Meta Platforms Inc.
-        }
+    # Defaults for optional columns missing from a chain (IV: 20% volatility)
+    OPTIONAL_DEFAULTS = {
+        'open_interest': 0, 'volume': 0, 'bid': 0.0, 'ask': 0.0, 'last_price': 0.0, 'implied_volatility': 0.2
+    }
+    
+    def __init__(self, session: Optional[Any] = None):
+        """
+        Initialize the fetcher
+        
+        Args:
+            session: Optional HTTP session passed to every yf.Ticker. By default
+                yfinance's own process-wide session is used, which already
+                pools keep-alive connections across tickers and threads.
+        """
+        self.popular_symbols = dict(POPULAR_SYMBOLS)
+        self.session = session
+        self._tickers = MemoryCache()
+    
+    def _ticker(self, yf_symbol: str) -> yf.Ticker:
+        """
+        Get a yfinance Ticker bound to this fetcher's session
+        
+        A Ticker keeps the expirations, info and prices it has downloaded, so
+        one is reused for TICKER_CACHE_TTL seconds (long enough for a
+        validate -> expirations -> chain flow to share its downloads) and
+        then replaced so later lookups see fresh data.
+        
+        Args:
+            yf_symbol: Yahoo Finance symbol
+            
+        Returns:
+            yf.Ticker for the symbol
+        """
+        ticker = self._tickers.get(yf_symbol, TICKER_CACHE_TTL)
+        if ticker is None:
+            ticker = yf.Ticker(yf_symbol, session=self.session)
+            self._tickers.set(yf_symbol, ticker)
+        return ticker
     
     def get_available_symbols(self) -> Dict[str, str]:
         """Get list of popular symbols for quick selection"""
         return self.popular_symbols.copy()
     
+    def invalidate(self, symbol: str) -> None:
+        """
+        Drop the cached price and expiration dates for a symbol
+        
+        Args:
+            symbol: Symbol whose next lookups should go to Yahoo Finance
+        """
+        yf_symbol = self.popular_symbols.get(symbol, symbol)
+        _QUOTE_CACHE.delete(('price', yf_symbol), ('expirations', yf_symbol))
+        self._tickers.delete(yf_symbol)
+    
     def validate_symbol(self, symbol: str) -> bool:
         """
         Validate if a symbol exists and has options data
@@ -53,9 +146,13 @@ class YFinanceOptionsFetcher:
             True if symbol is valid and has options
         """
         try:
-            ticker = yf.Ticker(symbol)
-            # Check if options are available
-            expirations = ticker.options
+            yf_symbol = self.popular_symbols.get(symbol, symbol)
+            expirations = _QUOTE_CACHE.get(('expirations', yf_symbol), EXPIRATIONS_CACHE_TTL)
+            if expirations is None:
+                # Check if options are available
+                _YAHOO_LIMITER.acquire()
+                expirations = list(self._ticker(yf_symbol).options)
+                _QUOTE_CACHE.set(('expirations', yf_symbol), expirations)
             return len(expirations) > 0
         except:
             return False
@@ -73,25 +170,175 @@ class YFinanceOptionsFetcher:
         try:
             # Check if it's a popular symbol with special mapping, otherwise use as-is
             yf_symbol = self.popular_symbols.get(symbol, symbol)
-            ticker = yf.Ticker(yf_symbol)
+            current_price = _QUOTE_CACHE.get(('price', yf_symbol), PRICE_CACHE_TTL)
+            if current_price is not None:
+                return current_price
             
-            # Get current price from info or recent data
-            info = ticker.info
-            current_price = info.get('regularMarketPrice') or info.get('previousClose')
+            ticker = self._ticker(yf_symbol)
+            return self._resolve_price(symbol, yf_symbol, ticker, self._fast_price(ticker))
             
-            if current_price is None:
-                # Fallback to recent data
-                hist = ticker.history(period='1d')
-                if not hist.empty:
-                    current_price = hist['Close'].iloc[-1]
+        except Exception as e:
+            raise YFinanceFetchError(f"Error fetching current price for {symbol}: {str(e)}")
+    
+    @staticmethod
+    def _fast_price(ticker: yf.Ticker) -> Optional[float]:
+        """
+        Read the last price from fast_info, or None if it is unavailable
+        
+        fast_info reads the light chart endpoint instead of the full (and most
+        heavily rate-limited) info payload. Only lastPrice is read: in yfinance,
+        previousClose can itself fall back to the info payload.
+        
+        Args:
+            ticker: Ticker to read
             
-            if current_price is None:
-                raise YFinanceFetchError(f"Could not fetch current price for {symbol}")
+        Returns:
+            Last traded price, or None so the caller falls back to recent history
+        """
+        try:
+            _YAHOO_LIMITER.acquire()
+            return float(ticker.fast_info['lastPrice'])
+        except Exception:
+            return None
+    
+    def _resolve_price(self, symbol: str, yf_symbol: str, ticker: yf.Ticker,
+                       current_price: Optional[float]) -> float:
+        """
+        Finish a price lookup: fall back to recent data if needed, then cache the price
+        
+        Args:
+            symbol: Symbol as requested (used in error messages)
+            yf_symbol: Yahoo Finance symbol (the cache key)
+            ticker: Ticker the price came from, used for the fallback
+            current_price: Price read from the ticker's quote, or None
+            
+        Returns:
+            Current price of the underlying
+        """
+        if current_price is None:
+            # Fallback to recent data
+            _YAHOO_LIMITER.acquire()
+            hist = ticker.history(period='1d')
+            if not hist.empty:
+                current_price = hist['Close'].iloc[-1]
+        
+        if current_price is None:
+            raise YFinanceFetchError(f"Could not fetch current price for {symbol}")
+        
+        current_price = float(current_price)
+        _QUOTE_CACHE.set(('price', yf_symbol), current_price)
+        return current_price
+    
+    def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for several underlyings with batched downloads
+        
+        Uncached symbols are priced YF_PRICE_BATCH_SIZE at a time with one
+        yf.download request per batch; any symbol a batch could not price
+        falls back to get_current_price.
+        
+        Args:
+            symbols: Symbols to fetch (e.g., ['SPY', 'SPX', 'AAPL'])
             
-            return float(current_price)
+        Returns:
+            Dictionary mapping each symbol that could be priced to its price
+        """
+        prices = {}
+        pending = {}  # Yahoo symbol -> requested symbols still without a price
+        for symbol in symbols:
+            yf_symbol = self.popular_symbols.get(symbol, symbol)
+            cached_price = _QUOTE_CACHE.get(('price', yf_symbol), PRICE_CACHE_TTL)
+            if cached_price is not None:
+                prices[symbol] = cached_price
+            else:
+                pending.setdefault(yf_symbol, []).append(symbol)
+        
+        yf_symbols = list(pending)
+        for start in range(0, len(yf_symbols), YF_PRICE_BATCH_SIZE):
+            batch = yf_symbols[start:start + YF_PRICE_BATCH_SIZE]
+            try:
+                _YAHOO_LIMITER.acquire()
+                data = yf.download(batch, period='5d', group_by='ticker', threads=True,
+                                   progress=False, session=self.session)
+            except Exception as e:
+                print(f"Warning: Batch price download failed for {', '.join(batch)}: {str(e)}")
+                continue
+            if data is None or data.empty:
+                continue
             
+            for yf_symbol in batch:
+                # Last close of the window is the latest traded price
+                try:
+                    closes = data[(yf_symbol, 'Close')].dropna()
+                except KeyError:
+                    continue
+                if closes.empty:
+                    continue
+                
+                price = float(closes.iloc[-1])
+                _QUOTE_CACHE.set(('price', yf_symbol), price)
+                for symbol in pending.pop(yf_symbol):
+                    prices[symbol] = price
+        
+        # Symbols the batches could not price go through the single-symbol path
+        for names in pending.values():
+            for symbol in names:
+                try:
+                    prices[symbol] = self.get_current_price(symbol)
+                except YFinanceFetchError as e:
+                    print(f"Warning: {str(e)}")
+        
+        return {symbol: prices[symbol] for symbol in symbols if symbol in prices}
+    
+    def get_ticker_snapshot(self, symbol: str) -> TickerSnapshot:
+        """
+        Get current price and expiration dates from one Ticker instance
+        
+        Uses fast_info for the price instead of the full info payload, and
+        records per-field errors instead of raising so callers can still use
+        whichever half succeeded.
+        
+        Args:
+            symbol: Symbol to fetch (e.g., 'SPY', 'SPX', 'AAPL')
+            
+        Returns:
+            TickerSnapshot with price and expirations
+        """
+        yf_symbol = self.popular_symbols.get(symbol, symbol)
+        ticker = self._ticker(yf_symbol)
+        
+        current_price = _QUOTE_CACHE.get(('price', yf_symbol), PRICE_CACHE_TTL)
+        price_error = None
+        if current_price is None:
+            try:
+                current_price = self._resolve_price(symbol, yf_symbol, ticker, self._fast_price(ticker))
+            except YFinanceFetchError as e:
+                current_price = None
+                price_error = str(e)
+            except Exception as e:
+                price_error = f"Error fetching current price for {symbol}: {str(e)}"
+        
+        expirations = _QUOTE_CACHE.get(('expirations', yf_symbol), EXPIRATIONS_CACHE_TTL)
+        expirations_error = None
+        try:
+            if expirations is None:
+                _YAHOO_LIMITER.acquire()
+                expirations = list(ticker.options)
+                _QUOTE_CACHE.set(('expirations', yf_symbol), expirations)
+            expirations = list(expirations)
+            if not expirations:
+                expirations_error = f"No options expiration dates found for {symbol}"
         except Exception as e:
-            raise YFinanceFetchError(f"Error fetching current price for {symbol}: {str(e)}")
+            expirations = []
+            expirations_error = f"Error fetching expiration dates for {symbol}: {str(e)}"
+        
+        return TickerSnapshot(
+            symbol=symbol,
+            current_price=current_price,
+            expirations=expirations,
+            price_error=price_error,
+            expirations_error=expirations_error
+        )
     
     def get_expiration_dates(self, symbol: str) -> List[str]:
         """
@@ -105,10 +352,12 @@ class YFinanceOptionsFetcher:
         """
         try:
             yf_symbol = self.popular_symbols.get(symbol, symbol)
-            ticker = yf.Ticker(yf_symbol)
-            
-            # Get expiration dates
-            expirations = ticker.options
+            expirations = _QUOTE_CACHE.get(('expirations', yf_symbol), EXPIRATIONS_CACHE_TTL)
+            if expirations is None:
+                # Get expiration dates
+                _YAHOO_LIMITER.acquire()
+                expirations = list(self._ticker(yf_symbol).options)
+                _QUOTE_CACHE.set(('expirations', yf_symbol), expirations)
             
             if not expirations:
                 raise YFinanceFetchError(f"No options expiration dates found for {symbol}")
@@ -135,10 +384,12 @@ class YFinanceOptionsFetcher:
         """
         try:
             yf_symbol = self.popular_symbols.get(symbol, symbol)
-            ticker = yf.Ticker(yf_symbol)
+            ticker = self._ticker(yf_symbol)
             
-            # Get available expiration dates
+            # Get available expiration dates (option_chain needs them on this ticker anyway)
+            _YAHOO_LIMITER.acquire()
             expirations = ticker.options
+            _QUOTE_CACHE.set(('expirations', yf_symbol), list(expirations))
             
             if not expirations:
                 raise YFinanceFetchError(f"No options data available for {symbol}")
@@ -154,38 +405,40 @@ class YFinanceOptionsFetcher:
                 # Use the nearest expiration
                 target_expirations = [expirations[0]]
             
-            all_options_data = []
-            
-            for exp_date in target_expirations:
+            def fetch_one(exp_date):
                 try:
                     # Get options chain for this expiration
-                    options_chain = ticker.option_chain(exp_date)
-                    
-                    # Process calls
-                    calls_df = options_chain.calls.copy()
-                    calls_df['option_type'] = 'call'
-                    calls_df['expiry_date'] = exp_date
-                    calls_df['symbol'] = symbol
-                    
-                    # Process puts
-                    puts_df = options_chain.puts.copy()
-                    puts_df['option_type'] = 'put'
-                    puts_df['expiry_date'] = exp_date
-                    puts_df['symbol'] = symbol
-                    
-                    # Combine calls and puts
-                    combined_df = pd.concat([calls_df, puts_df], ignore_index=True)
-                    all_options_data.append(combined_df)
-                    
+                    _YAHOO_LIMITER.acquire()
+                    return ticker.option_chain(exp_date)
                 except Exception as e:
                     print(f"Warning: Could not fetch data for expiration {exp_date}: {str(e)}")
-                    continue
+                    return None
+            
+            # Each expiration is an independent HTTP round-trip, so overlap the waits
+            max_workers = min(YF_MAX_CONCURRENT_REQUESTS, len(target_expirations))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                option_chains = list(executor.map(fetch_one, target_expirations))
+            
+            # Calls and puts frames of every expiration, with the (option_type code, expiry_date) of each
+            frames = []
+            frame_labels = []
+            for exp_date, options_chain in zip(target_expirations, option_chains):
+                if options_chain is not None:
+                    frames.extend([options_chain.calls, options_chain.puts])
+                    frame_labels.extend([(0, exp_date), (1, exp_date)])
             
-            if not all_options_data:
+            if not frames:
                 raise YFinanceFetchError(f"No options data could be fetched for {symbol}")
             
-            # Combine all expiration data
-            final_df = pd.concat(all_options_data, ignore_index=True)
+            # Combine all expiration data in one concat, then label each frame's rows in one pass
+            final_df = pd.concat(frames, ignore_index=True)
+            frame_lengths = [len(frame) for frame in frames]
+            type_codes, expiry_dates = zip(*frame_labels)
+            final_df['option_type'] = pd.Categorical.from_codes(np.repeat(type_codes, frame_lengths),
+                                                                dtype=OPTION_TYPE_DTYPE)
+            # Parse each expiration date once and repeat the timestamps instead of parsing every row
+            final_df['expiry_date'] = np.repeat(pd.to_datetime(list(expiry_dates)).to_numpy(), frame_lengths)
+            final_df['symbol'] = symbol
             
             # Standardize column names to match our expected format
             final_df = self._standardize_columns(final_df)
@@ -218,67 +471,48 @@ class YFinanceOptionsFetcher:
             'symbol': 'symbol'
         }
         
-        # Rename columns
-        available_columns = {col: column_mapping.get(col, col) for col in df.columns if col in column_mapping}
-        df = df.rename(columns=available_columns)
+        # Rename columns in one pass over the header (names not in the mapping are kept)
+        df = df.set_axis([column_mapping.get(col, col) for col in df.columns], axis=1)
         
         # Ensure required columns exist
-        required_columns = ['strike', 'option_type', 'expiry_date', 'symbol']
-        for col in required_columns:
-            if col not in df.columns:
-                if col == 'symbol':
-                    df[col] = 'SPY'  # Default symbol
-                else:
-                    raise YFinanceFetchError(f"Required column {col} not found in options data")
-        
-        # Add missing optional columns with defaults
-        if 'open_interest' not in df.columns:
-            df['open_interest'] = 0
-        if 'volume' not in df.columns:
-            df['volume'] = 0
-        if 'bid' not in df.columns:
-            df['bid'] = 0.0
-        if 'ask' not in df.columns:
-            df['ask'] = 0.0
-        if 'last_price' not in df.columns:
-            df['last_price'] = 0.0
-        if 'implied_volatility' not in df.columns:
-            df['implied_volatility'] = 0.2
+        columns = set(df.columns)
+        for col in ['strike', 'option_type', 'expiry_date']:
+            if col not in columns:
+                raise YFinanceFetchError(f"Required column {col} not found in options data")
+        
+        # Add every missing column with its default in one assign
+        missing = {col: value for col, value in {'symbol': 'SPY', **self.OPTIONAL_DEFAULTS}.items()
+                   if col not in columns}
+        if missing:
+            df = df.assign(**missing)
         
         return df
     
     def _clean_options_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and validate options data"""
         
-        # Remove rows with invalid strikes
-        df = df[df['strike'] > 0]
-        
         # Convert expiry_date to datetime and set to 4 PM ET (market close)
-        df['expiry_date'] = pd.to_datetime(df['expiry_date'])
-        
-        # Set expiry time to 4 PM (16:00) - options expire at market close
         # This provides more accurate time-to-expiry calculations
-        df['expiry_date'] = df['expiry_date'].apply(
-            lambda x: datetime.combine(x.date(), datetime.min.time().replace(hour=16))
-        )
+        expiry = pd.to_datetime(df['expiry_date']).dt.normalize() + pd.Timedelta(hours=16)
         
-        # Remove expired options (allow options expiring today)
+        # Remove rows with invalid strikes and expired options (allow options expiring today)
+        # with one mask, so the frame is sliced once
         today = pd.Timestamp.now().normalize()
-        df = df[df['expiry_date'] >= today]  # Changed from > to >= to include today
+        keep = ((df['strike'] > 0) & (expiry >= today)).to_numpy()
+        df = df.loc[keep].assign(expiry_date=expiry[keep])
         
         # Fill NaN values
         numeric_columns = ['open_interest', 'volume', 'bid', 'ask', 'last_price', 'implied_volatility']
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = df[col].fillna(0)
+        df[numeric_columns] = df[numeric_columns].fillna(0)
         
-        # Ensure positive values for certain columns
-        df['open_interest'] = df['open_interest'].abs()
-        df['volume'] = df['volume'].abs()
-        df['implied_volatility'] = df['implied_volatility'].abs()
+        # Ensure positive values for certain columns, with a 1% implied volatility floor
+        positive_columns = ['open_interest', 'volume', 'implied_volatility']
+        df[positive_columns] = df[positive_columns].abs()
+        df['implied_volatility'] = df['implied_volatility'].clip(lower=0.01)
         
-        # Set minimum implied volatility
-        df.loc[df['implied_volatility'] < 0.01, 'implied_volatility'] = 0.01
+        # Counts are whole numbers; int32 holds any real open interest or volume (as in processor.py).
+        # Prices and IV stay float64: float32 is an opt-in precision of the gamma kernel instead
+        df = df.astype({'open_interest': np.int32, 'volume': np.int32})
         
         # IV Normalization Strategy (same as processor.py):
         # Yahoo Finance usually returns IV as decimal (0.25 = 25%, 1.5 = 150%)
@@ -319,24 +553,32 @@ class YFinanceOptionsFetcher:
         """
         try:
             yf_symbol = self.popular_symbols.get(symbol, symbol)
-            ticker = yf.Ticker(yf_symbol)
+            ticker = self._ticker(yf_symbol)
             
-            # Get basic info
+            # Get basic info; the price comes out of the same info payload
+            _YAHOO_LIMITER.acquire()
             info = ticker.info
-            current_price = self.get_current_price(symbol)
+            current_price = _QUOTE_CACHE.get(('price', yf_symbol), PRICE_CACHE_TTL)
+            if current_price is None:
+                current_price = self._resolve_price(symbol, yf_symbol, ticker,
+                                                    info.get('regularMarketPrice') or info.get('previousClose'))
+            _YAHOO_LIMITER.acquire()
             expirations = ticker.options
+            _QUOTE_CACHE.set(('expirations', yf_symbol), list(expirations))
             
             # Get sample options chain for analysis
             if expirations:
+                _YAHOO_LIMITER.acquire()
                 sample_chain = ticker.option_chain(expirations[0])
                 total_calls = len(sample_chain.calls)
                 total_puts = len(sample_chain.puts)
                 
                 # Calculate strike range
-                all_strikes = list(sample_chain.calls['strike']) + list(sample_chain.puts['strike'])
+                all_strikes = np.concatenate([sample_chain.calls['strike'].to_numpy(dtype=float),
+                                              sample_chain.puts['strike'].to_numpy(dtype=float)])
                 strike_range = {
-                    'min': min(all_strikes) if all_strikes else 0,
-                    'max': max(all_strikes) if all_strikes else 0
+                    'min': float(all_strikes.min()) if all_strikes.size else 0,
+                    'max': float(all_strikes.max()) if all_strikes.size else 0
                 }
             else:
                 total_calls = 0
@@ -372,30 +614,16 @@ class YFinanceOptionsFetcher:
         Returns:
             List of OptionsContract objects
         """
-        contracts = []
-        skipped_rows = 0
-        
-        for _, row in df.iterrows():
-            try:
-                contract = OptionsContract(
-                    symbol=row.get('symbol', 'SPY'),
-                    strike=float(row['strike']),
-                    expiry_date=pd.to_datetime(row['expiry_date']),
-                    option_type=str(row['option_type']).lower(),
-                    open_interest=int(row.get('open_interest', 0)),
-                    volume=int(row.get('volume', 0)),
-                    bid=float(row.get('bid', 0.0)),
-                    ask=float(row.get('ask', 0.0)),
-                    last_price=float(row.get('last_price', 0.0)),
-                    implied_volatility=float(row.get('implied_volatility', 0.2))
-                )
-                contracts.append(contract)
-            except (ValueError, KeyError) as e:
-                # Skip invalid rows
-                skipped_rows += 1
-                continue
+        # Rows that would fail conversion or validation are dropped in bulk, not one by one
+        try:
+            chain = OptionsChainSoA.from_dataframe(df, default_symbol='SPY', drop_invalid=True)
+        except ValueError as e:
+            # A required column is missing, so no row can be converted
+            print(f"Warning: Skipped {len(df)} invalid rows during contract conversion ({e})")
+            return []
         
+        skipped_rows = len(df) - len(chain)
         if skipped_rows > 0:
             print(f"Warning: Skipped {skipped_rows} invalid rows during contract conversion")
         
-        return contracts
\ No newline at end of file
+        return chain.to_contracts()
\ No newline at end of file
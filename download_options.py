@@ -7,40 +7,122 @@ Usage: python download_options.py SYMBOL [EXPIRATION]
 import sys
 import argparse
 from datetime import datetime
-import yfinance as yf
-import pandas as pd
+
+from app_config import DOWNLOAD_CACHE_TTL
+from data.cache import FileCache, make_key
+from data.yfinance_fetcher import YFinanceOptionsFetcher, YFinanceFetchError
+
+# pyarrow's C++ CSV writer is used when installed, pandas otherwise
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 
 def list_expirations(symbol):
     """List all available expiration dates for a symbol"""
     try:
-        ticker = yf.Ticker(symbol)
-        expirations = ticker.options
-        
-        if not expirations:
-            print(f"❌ No options available for {symbol}")
-            return []
-        
-        print(f"\n📅 Available expiration dates for {symbol}:")
-        print("-" * 50)
-        for i, exp_date in enumerate(expirations, 1):
-            print(f"{i:2d}. {exp_date}")
-        print("-" * 50)
-        
-        return expirations
-    except Exception as e:
-        print(f"❌ Error fetching expirations: {str(e)}")
+        expirations = YFinanceOptionsFetcher().get_expiration_dates(symbol)
+    except YFinanceFetchError as e:
+        print(f"❌ {str(e)}")
         return []
+    
+    print(f"\n📅 Available expiration dates for {symbol}:")
+    print("-" * 50)
+    for i, exp_date in enumerate(expirations, 1):
+        print(f"{i:2d}. {exp_date}")
+    print("-" * 50)
+    
+    return expirations
+
+
+def write_csv(df, output_file):
+    """
+    Write a DataFrame to CSV without its index
+    
+    Args:
+        df: DataFrame to write
+        output_file: Output CSV filename
+    """
+    if PYARROW_AVAILABLE:
+        # Same values as to_csv; text fields are quoted and whole floats lose their ".0"
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output_file)
+    else:
+        df.to_csv(output_file, index=False)
 
 
-def download_options_chain(symbol, expiration=None, output_file=None):
+def _fetch_chain(symbol, expiration=None):
+    """
+    Fetch an options chain and current price through YFinanceOptionsFetcher
+    
+    Args:
+        symbol: Stock symbol (e.g., 'SPY', 'AAPL')
+        expiration: Expiration date (YYYY-MM-DD) or None for nearest
+    
+    Returns:
+        (final_df, selected_expiration, current_price) tuple, or None if the
+        symbol has no options or the expiration is not available
+    """
+    fetcher = YFinanceOptionsFetcher()
+    
+    # Get available expirations
+    try:
+        expirations = fetcher.get_expiration_dates(symbol)
+    except YFinanceFetchError:
+        print(f"❌ No options available for {symbol}")
+        return None
+    
+    # Determine which expiration to use
+    if expiration:
+        if expiration not in expirations:
+            print(f"❌ Expiration {expiration} not available")
+            print(f"Available expirations: {', '.join(expirations[:5])}...")
+            return None
+        selected_expiration = expiration
+    else:
+        selected_expiration = expirations[0]
+        print(f"📅 Using nearest expiration: {selected_expiration}")
+    
+    # Fetch options chain (standardized and cleaned by the fetcher, as in the app)
+    print(f"⏳ Fetching options data...")
+    options_df = fetcher.fetch_options_chain(symbol, expiration_date=selected_expiration)
+    
+    # Get current price
+    try:
+        current_price = fetcher.get_current_price(symbol)
+    except YFinanceFetchError:
+        current_price = None
+    
+    # Select and order columns
+    output_columns = [
+        'symbol', 'strike', 'expiry_date', 'option_type',
+        'last_price', 'bid', 'ask', 'volume', 'open_interest', 'implied_volatility'
+    ]
+    
+    # Keep only columns that exist; the CSV keeps plain YYYY-MM-DD expiry dates
+    final_df = options_df[[col for col in output_columns if col in options_df.columns]]
+    final_df = final_df.assign(expiry_date=final_df['expiry_date'].dt.strftime('%Y-%m-%d'))
+    
+    # Sort by strike and option type
+    final_df = final_df.sort_values(['strike', 'option_type']).reset_index(drop=True)
+    
+    return final_df, selected_expiration, current_price
+
+
+def download_options_chain(symbol, expiration=None, output_file=None, use_cache=True):
     """
     Download options chain data and save to CSV
     
+    A download is reused for DOWNLOAD_CACHE_TTL seconds, so re-running the
+    same symbol and expiration shortly after skips Yahoo Finance entirely.
+    
     Args:
         symbol: Stock symbol (e.g., 'SPY', 'AAPL')
         expiration: Expiration date (YYYY-MM-DD) or None for nearest
         output_file: Output CSV filename or None for auto-generated
+        use_cache: Whether to reuse a recent download of the same chain
     
     Returns:
         Path to saved CSV file or None on error
@@ -48,87 +130,17 @@ def download_options_chain(symbol, expiration=None, output_file=None):
     try:
         print(f"\n📊 Downloading options chain for {symbol}...")
         
-        # Get ticker
-        ticker = yf.Ticker(symbol)
-        
-        # Get available expirations
-        expirations = ticker.options
-        if not expirations:
-            print(f"❌ No options available for {symbol}")
-            return None
-        
-        # Determine which expiration to use
-        if expiration:
-            if expiration not in expirations:
-                print(f"❌ Expiration {expiration} not available")
-                print(f"Available expirations: {', '.join(expirations[:5])}...")
-                return None
-            selected_expiration = expiration
+        cache = FileCache()
+        cache_key = make_key('download_options_chain', symbol, expiration)
+        result = cache.get(cache_key, DOWNLOAD_CACHE_TTL) if use_cache else None
+        if result is not None:
+            print(f"♻️ Using download from the last {DOWNLOAD_CACHE_TTL // 60} minutes (--no-cache to refetch)")
         else:
-            selected_expiration = expirations[0]
-            print(f"📅 Using nearest expiration: {selected_expiration}")
-        
-        # Fetch options chain
-        print(f"⏳ Fetching options data...")
-        options_chain = ticker.option_chain(selected_expiration)
-        
-        # Get current price
-        try:
-            info = ticker.info
-            current_price = info.get('regularMarketPrice') or info.get('previousClose')
-            if current_price is None:
-                hist = ticker.history(period='1d')
-                if not hist.empty:
-                    current_price = hist['Close'].iloc[-1]
-        except:
-            current_price = None
-        
-        # Process calls
-        calls_df = options_chain.calls.copy()
-        calls_df['option_type'] = 'call'
-        calls_df['expiry_date'] = selected_expiration
-        calls_df['symbol'] = symbol
-        
-        # Process puts
-        puts_df = options_chain.puts.copy()
-        puts_df['option_type'] = 'put'
-        puts_df['expiry_date'] = selected_expiration
-        puts_df['symbol'] = symbol
-        
-        # Combine
-        combined_df = pd.concat([calls_df, puts_df], ignore_index=True)
-        
-        # Standardize column names
-        column_mapping = {
-            'strike': 'strike',
-            'lastPrice': 'last_price',
-            'bid': 'bid',
-            'ask': 'ask',
-            'volume': 'volume',
-            'openInterest': 'open_interest',
-            'impliedVolatility': 'implied_volatility',
-            'option_type': 'option_type',
-            'expiry_date': 'expiry_date',
-            'symbol': 'symbol'
-        }
-        
-        # Rename columns
-        available_columns = {col: column_mapping.get(col, col) 
-                           for col in combined_df.columns if col in column_mapping}
-        combined_df = combined_df.rename(columns=available_columns)
-        
-        # Select and order columns
-        output_columns = [
-            'symbol', 'strike', 'expiry_date', 'option_type',
-            'last_price', 'bid', 'ask', 'volume', 'open_interest', 'implied_volatility'
-        ]
-        
-        # Keep only columns that exist
-        output_columns = [col for col in output_columns if col in combined_df.columns]
-        final_df = combined_df[output_columns]
-        
-        # Sort by strike and option type
-        final_df = final_df.sort_values(['strike', 'option_type']).reset_index(drop=True)
+            result = _fetch_chain(symbol, expiration)
+            if result is None:
+                return None
+            cache.set(cache_key, result)
+        final_df, selected_expiration, current_price = result
         
         # Generate output filename if not provided
         if output_file is None:
@@ -136,7 +148,11 @@ def download_options_chain(symbol, expiration=None, output_file=None):
             output_file = f"{symbol}_{selected_expiration}_{timestamp}.csv"
         
         # Save to CSV
-        final_df.to_csv(output_file, index=False)
+        write_csv(final_df, output_file)
+        
+        # One aggregation call for the strike stats; value_counts counts both types in one pass
+        strike_stats = final_df['strike'].agg(['nunique', 'min', 'max'])
+        type_counts = final_df['option_type'].value_counts().reindex(['call', 'put'], fill_value=0)
         
         # Display summary
         print(f"\n✅ Successfully downloaded options chain!")
@@ -147,15 +163,13 @@ def download_options_chain(symbol, expiration=None, output_file=None):
             print(f"   Current Price: ${current_price:.2f}")
         print(f"   Expiration: {selected_expiration}")
         print(f"   Total Contracts: {len(final_df)}")
-        print(f"   Calls: {len(final_df[final_df['option_type'] == 'call'])}")
-        print(f"   Puts: {len(final_df[final_df['option_type'] == 'put'])}")
-        print(f"   Unique Strikes: {final_df['strike'].nunique()}")
+        print(f"   Calls: {type_counts['call']}")
+        print(f"   Puts: {type_counts['put']}")
+        print(f"   Unique Strikes: {int(strike_stats['nunique'])}")
         print(f"   Total Open Interest: {final_df['open_interest'].sum():,.0f}")
         
         # Show strike range
-        min_strike = final_df['strike'].min()
-        max_strike = final_df['strike'].max()
-        print(f"   Strike Range: {min_strike:.0f} - {max_strike:.0f}")
+        print(f"   Strike Range: {strike_stats['min']:.0f} - {strike_stats['max']:.0f}")
         
         # Show sample data
         print(f"\n📋 Sample Data (first 5 rows):")
@@ -191,6 +205,9 @@ Examples:
   
   # Interactive mode
   python download_options.py SPY --interactive
+  
+  # Ignore a download of the same chain from the last few minutes
+  python download_options.py SPY --no-cache
         """
     )
     
@@ -199,6 +216,7 @@ Examples:
     parser.add_argument('--list', '-l', action='store_true', help='List available expirations and exit')
     parser.add_argument('--output', '-o', help='Output CSV filename')
     parser.add_argument('--interactive', '-i', action='store_true', help='Interactive expiration selection')
+    parser.add_argument('--no-cache', action='store_true', help='Always fetch from Yahoo Finance, ignoring recent downloads')
     
     args = parser.parse_args()
     
@@ -233,7 +251,7 @@ Examples:
         expiration = args.expiration
     
     # Download options chain
-    result = download_options_chain(symbol, expiration, args.output)
+    result = download_options_chain(symbol, expiration, args.output, use_cache=not args.no_cache)
     
     return 0 if result else 1
 
@@ -352,14 +352,15 @@ def export_gamma_details_to_csv(contracts: list, current_price: float, gamma_cal
             
             # Calculate d1 for Black-Scholes
             import numpy as np
-            from scipy.stats import norm
+            from calculations.gamma import INV_SQRT_2PI
             
             d1 = (np.log(current_price / contract.strike) + 
                   (gamma_calc.risk_free_rate + 0.5 * volatility**2) * time_to_expiry) / \
                  (volatility * np.sqrt(time_to_expiry))
             
-            # Calculate gamma (same for calls and puts)
-            gamma = norm.pdf(d1) / (current_price * volatility * np.sqrt(time_to_expiry))
+            # Calculate gamma (same for calls and puts), normal pdf in closed form
+            norm_pdf_d1 = INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+            gamma = norm_pdf_d1 / (current_price * volatility * np.sqrt(time_to_expiry))
             
             # Calculate exposure
             exposure_base = gamma * contract.open_interest * gamma_calc.contract_multiplier * current_price
@@ -400,7 +401,7 @@ def export_gamma_details_to_csv(contracts: list, current_price: float, gamma_cal
                 'Distance_Percent': f"{distance_pct:.2f}%",
                 'Moneyness': moneyness,
                 'd1': f"{d1:.6f}",
-                'norm_pdf_d1': f"{norm.pdf(d1):.8f}",
+                'norm_pdf_d1': f"{norm_pdf_d1:.8f}",
                 'Gamma': f"{gamma:.8f}",
                 'Contract_Multiplier': gamma_calc.contract_multiplier,
                 'Exposure_Base': f"{exposure_base:.2f}",
@@ -0,0 +1,44 @@
+"""
+Regression checks for options data loading
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import data.processor as processor
+from data.processor import OptionsDataProcessor
+
+BLANK_CELLS_CSV = (
+    "symbol,strike,expiry_date,option_type,open_interest,volume,implied_volatility\n"
+    "SPY,500,2099-01-17,call,100,10,0.2\n"
+    "SPY,505,2099-01-17,,200,,0.25\n"
+    ",510,2099-01-17,put,300,30,NA\n"
+)
+
+
+def _load(monkeypatch, use_pyarrow: bool) -> pd.DataFrame:
+    monkeypatch.setattr(processor, 'PYARROW_AVAILABLE', use_pyarrow)
+    return OptionsDataProcessor().load_options_data(io.BytesIO(BLANK_CELLS_CSV.encode()))
+
+
+@pytest.mark.skipif(not processor.PYARROW_AVAILABLE, reason="pyarrow not installed")
+def test_pyarrow_and_pandas_readers_agree_on_blank_cells(monkeypatch):
+    with_pandas = _load(monkeypatch, use_pyarrow=False)
+    with_pyarrow = _load(monkeypatch, use_pyarrow=True)
+    
+    # The row with a blank option_type is dropped as critical missing data
+    assert len(with_pyarrow) == 2
+    # pyarrow declares strikes float64 where pandas infers int64 for whole numbers
+    pd.testing.assert_frame_equal(with_pyarrow, with_pandas, check_dtype=False)
+
+
+def test_blank_option_type_rows_convert(monkeypatch):
+    df = _load(monkeypatch, use_pyarrow=processor.PYARROW_AVAILABLE)
+    contracts = OptionsDataProcessor().convert_to_contracts(df)
+    assert [c.option_type for c in contracts] == ['call', 'put']